@@ -1,37 +1,56 @@
 """High-level helpers for aware release pipeline orchestration."""
 
-from .pipeline import (
-    prepare_release,
-    publish_awarerelease_pypi,
-    publish_release,
-    refresh_terminal_providers,
-    render_rules,
-    validate_terminal_providers,
-)
-from .pipelines import (
-    PipelineContext,
-    PipelineError,
-    PipelineInputSpec,
-    PipelineResult,
-    PipelineSpec,
-    get_pipeline,
-    list_pipelines,
-    register_pipeline,
-)
+from __future__ import annotations
 
-__all__ = [
-    "prepare_release",
-    "publish_release",
-    "render_rules",
-    "refresh_terminal_providers",
-    "validate_terminal_providers",
-    "publish_awarerelease_pypi",
-    "PipelineContext",
-    "PipelineError",
-    "PipelineInputSpec",
-    "PipelineResult",
-    "PipelineSpec",
-    "get_pipeline",
-    "list_pipelines",
-    "register_pipeline",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pipeline import (
+        prepare_release,
+        publish_awarerelease_pypi,
+        publish_release,
+        refresh_terminal_providers,
+        render_rules,
+        validate_terminal_providers,
+    )
+    from .pipelines import (
+        PipelineContext,
+        PipelineError,
+        PipelineInputSpec,
+        PipelineResult,
+        PipelineSpec,
+        get_pipeline,
+        list_pipelines,
+        register_pipeline,
+    )
+
+# Submodules are imported on first attribute access so the CLI can parse
+# arguments without paying for the pipeline and workflow machinery up front.
+_EXPORTS = {
+    "prepare_release": ".pipeline",
+    "publish_release": ".pipeline",
+    "render_rules": ".pipeline",
+    "refresh_terminal_providers": ".pipeline",
+    "validate_terminal_providers": ".pipeline",
+    "publish_awarerelease_pypi": ".pipeline",
+    "PipelineContext": ".pipelines",
+    "PipelineError": ".pipelines",
+    "PipelineInputSpec": ".pipelines",
+    "PipelineResult": ".pipelines",
+    "PipelineSpec": ".pipelines",
+    "get_pipeline": ".pipelines",
+    "list_pipelines": ".pipelines",
+    "register_pipeline": ".pipelines",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
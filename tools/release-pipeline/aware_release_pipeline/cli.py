@@ -2,87 +2,121 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
 import subprocess
 import sys
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
-
-from aware_release.workflows import WorkflowTriggerError, trigger_workflow
-from aware_release.secrets import use_dotenv
-
-from .pipeline import (
-    prepare_release,
-    publish_release,
-    publish_awarerelease_pypi,
-    refresh_terminal_providers,
-    render_rules,
-    validate_terminal_providers,
-)
-from .pipelines import (
-    PipelineContext,
-    PipelineError,
-    PipelineResult,
-    PipelineSpec,
-    get_pipeline as get_pipeline_spec,
-    list_pipelines as list_pipeline_specs,
-)
-from .workflows import get_workflow, list_workflows
+from typing import TYPE_CHECKING
+
+from .fileops import clone_file
+
+if TYPE_CHECKING:
+    from .pipelines import PipelineResult
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+_ENV_FILE = _REPO_ROOT / ".env"
+_ENV_LOADED_VAR = "AWARE_ENV_LOADED"
 
 
+@lru_cache(maxsize=1)
 def _load_local_env() -> None:
     """Best-effort load of repo-local .env for convenience."""
 
+    if os.environ.get(_ENV_LOADED_VAR) == "1":
+        return
+
     try:
         from dotenv import load_dotenv
     except ImportError:  # pragma: no cover - dependency declared, but guard just in case
         return
 
-    repo_root = Path(__file__).resolve().parent.parent.parent.parent
-    use_dotenv(repo_root / ".env")
-    env_file = repo_root / ".env"
-    if env_file.exists():
-        load_dotenv(env_file)
+    from aware_release.secrets import use_dotenv
+
+    # use_dotenv only feeds the secret resolvers; load_dotenv is still needed so
+    # subprocesses (uv, pytest, git) inherit the values through os.environ.
+    use_dotenv(_ENV_FILE)
+    if os.path.isfile(_ENV_FILE):
+        load_dotenv(_ENV_FILE)
+        os.environ[_ENV_LOADED_VAR] = "1"
+
+
+_Handler = Callable[[argparse.Namespace], int | None]
+
+_BOOL_ACTION = argparse.BooleanOptionalAction
+_UPDATE_CHOICES = ("copy", "symlink")
+
+_DEFAULT_WORKSPACE_ROOT = "."
+_DEFAULT_PLATFORM = "linux-x86_64"
+_DEFAULT_OUTPUT_DIR = "releases"
+_DEFAULT_RULES_ROOT = "docs/rules"
+_DEFAULT_MANIFESTS_DIR = "libs/providers/terminal/aware_terminal_providers/providers"
+_DEFAULT_GITHUB_API = "https://api.github.com"
+
+_CHANNEL_FLAG = ("--channel", {"required": True})
+_VERSION_FLAG = ("--version", {"required": True})
+_PLATFORM_FLAG = ("--platform", {"default": _DEFAULT_PLATFORM})
+_OUTPUT_DIR_FLAG = ("--output-dir", {"default": _DEFAULT_OUTPUT_DIR})
+_WORKSPACE_ROOT_FLAG = ("--workspace-root", {"default": _DEFAULT_WORKSPACE_ROOT})
+
+_PREPARE_FLAGS: tuple[tuple[str, dict[str, object]], ...] = (
+    _CHANNEL_FLAG,
+    _VERSION_FLAG,
+    _PLATFORM_FLAG,
+    ("--wheel", {"action": "append", "required": True}),
+    _OUTPUT_DIR_FLAG,
+    ("--providers-dir", {"action": "append"}),
+    ("--provider-wheel", {"action": "append"}),
+    ("--dependencies-file", {}),
+    ("--manifest-override", {"action": "append"}),
+    ("--generate-lock", {"action": "store_true"}),
+    ("--lock-output", {}),
+    ("--python-version", {}),
+    _WORKSPACE_ROOT_FLAG,
+)
+
+_PUBLISH_FLAGS: tuple[tuple[str, dict[str, object]], ...] = (
+    _CHANNEL_FLAG,
+    _VERSION_FLAG,
+    _PLATFORM_FLAG,
+    _OUTPUT_DIR_FLAG,
+    ("--adapter", {"default": "noop"}),
+    ("--adapter-command", {}),
+    ("--adapter-arg", {"action": "append"}),
+    ("--releases-json", {}),
+    ("--url", {}),
+    ("--notes", {}),
+    ("--signature-command", {}),
+    ("--actor", {}),
+    ("--dry-run", {"action": _BOOL_ACTION, "default": False}),
+    _WORKSPACE_ROOT_FLAG,
+)
+
+
+def _add_flags(parser: argparse.ArgumentParser, flags: tuple[tuple[str, dict[str, object]], ...]) -> None:
+    for name, kwargs in flags:
+        parser.add_argument(name, **kwargs)
 
 
 def _add_prepare_arguments(parser: argparse.ArgumentParser) -> None:
-    parser.add_argument("--channel", required=True)
-    parser.add_argument("--version", required=True)
-    parser.add_argument("--platform", default="linux-x86_64")
-    parser.add_argument("--wheel", action="append", required=True)
-    parser.add_argument("--output-dir", default="releases")
-    parser.add_argument("--providers-dir", action="append")
-    parser.add_argument("--provider-wheel", action="append")
-    parser.add_argument("--dependencies-file")
-    parser.add_argument("--manifest-override", action="append")
-    parser.add_argument("--generate-lock", action="store_true")
-    parser.add_argument("--lock-output")
-    parser.add_argument("--python-version")
-    parser.add_argument("--workspace-root", default=".")
+    _add_flags(parser, _PREPARE_FLAGS)
 
 
 def _add_publish_arguments(parser: argparse.ArgumentParser) -> None:
-    parser.add_argument("--channel", required=True)
-    parser.add_argument("--version", required=True)
-    parser.add_argument("--platform", default="linux-x86_64")
-    parser.add_argument("--output-dir", default="releases")
-    parser.add_argument("--adapter", default="noop")
-    parser.add_argument("--adapter-command")
-    parser.add_argument("--adapter-arg", action="append")
-    parser.add_argument("--releases-json")
-    parser.add_argument("--url")
-    parser.add_argument("--notes")
-    parser.add_argument("--signature-command")
-    parser.add_argument("--actor")
-    parser.add_argument("--dry-run", action=argparse.BooleanOptionalAction, default=False)
-    parser.add_argument("--workspace-root", default=".")
+    _add_flags(parser, _PUBLISH_FLAGS)
 
 
-def main(argv: list[str] | None = None) -> int:
-    _load_local_env()
-    parser = argparse.ArgumentParser(prog="release-pipeline", description="aware_release orchestration helper")
-    subparsers = parser.add_subparsers(dest="command", required=True)
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
+def _print_json(payload: object) -> None:
+    sys.stdout.writelines(_JSON_ENCODER.iterencode(payload))
+    sys.stdout.write("\n")
+
 
+def _build_cli_parser(subparsers: argparse._SubParsersAction) -> None:
     cli_parser = subparsers.add_parser("cli", help="aware-cli bundle workflows")
     cli_subparsers = cli_parser.add_subparsers(dest="cli_command", required=True)
 
@@ -92,246 +126,352 @@ def main(argv: list[str] | None = None) -> int:
     publish = cli_subparsers.add_parser("publish", help="Publish bundle using configured adapter")
     _add_publish_arguments(publish)
 
-    # Legacy aliases (to be deprecated once all callers migrate)
+    aware_release_cmd = cli_subparsers.add_parser("aware-release", help="aware-release package helpers")
+    aware_release_subparsers = aware_release_cmd.add_subparsers(dest="aware_release_command", required=True)
+    aware_release_publish = aware_release_subparsers.add_parser("publish-pypi", help="Build and publish aware-release to PyPI")
+    aware_release_publish.add_argument("--workspace-root", default=_DEFAULT_WORKSPACE_ROOT)
+    aware_release_publish.add_argument("--build-dir", default="dist")
+    aware_release_publish.add_argument("--pyproject", default="tools/release/pyproject.toml")
+    aware_release_publish.add_argument("--repository", default="pypi")
+    aware_release_publish.add_argument("--dry-run", action=_BOOL_ACTION, default=False)
+
+
+# Legacy aliases (to be deprecated once all callers migrate)
+def _build_legacy_prepare_parser(subparsers: argparse._SubParsersAction) -> None:
     legacy_prepare = subparsers.add_parser("prepare", help=argparse.SUPPRESS)
     _add_prepare_arguments(legacy_prepare)
+
+
+def _build_legacy_publish_parser(subparsers: argparse._SubParsersAction) -> None:
     legacy_publish = subparsers.add_parser("publish", help=argparse.SUPPRESS)
     _add_publish_arguments(legacy_publish)
 
+
+def _build_rules_parser(subparsers: argparse._SubParsersAction) -> None:
     rules = subparsers.add_parser("rules", help="Rule automation helpers")
     rules_subparsers = rules.add_subparsers(dest="rules_command", required=True)
 
     rules_render = rules_subparsers.add_parser("render", help="Generate rule versions via aware-cli")
     rules_render.add_argument("--version")
-    rules_render.add_argument("--rules-root", default="docs/rules")
+    rules_render.add_argument("--rules-root", default=_DEFAULT_RULES_ROOT)
     rules_render.add_argument("--manifest", default="build/rule-manifest.json")
-    rules_render.add_argument("--update-current", choices=["copy", "symlink"], default="copy")
-    rules_render.add_argument("--workspace-root", default=".")
+    rules_render.add_argument("--update-current", choices=_UPDATE_CHOICES, default="copy")
+    rules_render.add_argument("--workspace-root", default=_DEFAULT_WORKSPACE_ROOT)
     rules_render.add_argument("--keep-manifest", action="store_true", help="Append to existing manifest instead of recreating")
 
+
+def _build_terminal_parser(subparsers: argparse._SubParsersAction) -> None:
     terminal = subparsers.add_parser("terminal", help="Terminal providers automation")
     terminal_subparsers = terminal.add_subparsers(dest="terminal_command", required=True)
 
     terminal_refresh = terminal_subparsers.add_parser("refresh", help="Refresh provider manifests via updater script")
-    terminal_refresh.add_argument("--workspace-root", default=".")
-    terminal_refresh.add_argument("--manifests-dir", default="libs/providers/terminal/aware_terminal_providers/providers")
+    terminal_refresh.add_argument("--workspace-root", default=_DEFAULT_WORKSPACE_ROOT)
+    terminal_refresh.add_argument("--manifests-dir", default=_DEFAULT_MANIFESTS_DIR)
 
     terminal_validate = terminal_subparsers.add_parser("validate", help="Validate provider manifests for schema and duplicates")
-    terminal_validate.add_argument("--workspace-root", default=".")
-    terminal_validate.add_argument("--manifests-dir", default="libs/providers/terminal/aware_terminal_providers/providers")
+    terminal_validate.add_argument("--workspace-root", default=_DEFAULT_WORKSPACE_ROOT)
+    terminal_validate.add_argument("--manifests-dir", default=_DEFAULT_MANIFESTS_DIR)
 
-    aware_release_cmd = cli_subparsers.add_parser("aware-release", help="aware-release package helpers")
-    aware_release_subparsers = aware_release_cmd.add_subparsers(dest="aware_release_command", required=True)
-    aware_release_publish = aware_release_subparsers.add_parser("publish-pypi", help="Build and publish aware-release to PyPI")
-    aware_release_publish.add_argument("--workspace-root", default=".")
-    aware_release_publish.add_argument("--build-dir", default="dist")
-    aware_release_publish.add_argument("--pyproject", default="tools/release/pyproject.toml")
-    aware_release_publish.add_argument("--repository", default="pypi")
-    aware_release_publish.add_argument("--dry-run", action=argparse.BooleanOptionalAction, default=False)
 
+def _build_workflow_parser(subparsers: argparse._SubParsersAction) -> None:
     workflow = subparsers.add_parser("workflow", help="Inspect and trigger registered workflows")
     workflow_subparsers = workflow.add_subparsers(dest="workflow_command", required=True)
 
-    workflow_list = workflow_subparsers.add_parser("list", help="List known workflows")
+    workflow_subparsers.add_parser("list", help="List known workflows")
 
     workflow_trigger = workflow_subparsers.add_parser("trigger", help="Dispatch a workflow by slug")
     workflow_trigger.add_argument("--workflow", required=True, dest="workflow_slug")
     workflow_trigger.add_argument("--ref")
     workflow_trigger.add_argument("--input", action="append")
     workflow_trigger.add_argument("--token-env")
-    workflow_trigger.add_argument("--dry-run", action=argparse.BooleanOptionalAction, default=False)
-    workflow_trigger.add_argument("--github-api", default="https://api.github.com")
+    workflow_trigger.add_argument("--dry-run", action=_BOOL_ACTION, default=False)
+    workflow_trigger.add_argument("--github-api", default=_DEFAULT_GITHUB_API)
+
 
+def _build_sdk_parser(subparsers: argparse._SubParsersAction) -> None:
     sdk_parser = subparsers.add_parser("sdk", help="aware-sdk helper commands")
     sdk_subparsers = sdk_parser.add_subparsers(dest="sdk_command", required=True)
     sdk_sync = sdk_subparsers.add_parser("sync", help="Sync staged SDK export into a target repository")
     sdk_sync.add_argument("--export-root", default="build/sdk-export")
     sdk_sync.add_argument("--target", required=True)
-    sdk_sync.add_argument("--dry-run", action=argparse.BooleanOptionalAction, default=False)
+    sdk_sync.add_argument("--dry-run", action=_BOOL_ACTION, default=False)
 
     sdk_publish = sdk_subparsers.add_parser("publish", help="Run the sdk-release pipeline, sync the export, commit, and push")
     sdk_publish.add_argument("--target", required=True)
     sdk_publish.add_argument("--branch", required=True)
-    sdk_publish.add_argument("--workspace-root", default=".")
-    sdk_publish.add_argument("--skip-versioning", action=argparse.BooleanOptionalAction, default=True)
-    sdk_publish.add_argument("--skip-workflow", action=argparse.BooleanOptionalAction, default=True)
-    sdk_publish.add_argument("--pipeline-dry-run", action=argparse.BooleanOptionalAction, default=False)
-    sdk_publish.add_argument("--skip-push", action=argparse.BooleanOptionalAction, default=False)
+    sdk_publish.add_argument("--workspace-root", default=_DEFAULT_WORKSPACE_ROOT)
+    sdk_publish.add_argument("--skip-versioning", action=_BOOL_ACTION, default=True)
+    sdk_publish.add_argument("--skip-workflow", action=_BOOL_ACTION, default=True)
+    sdk_publish.add_argument("--pipeline-dry-run", action=_BOOL_ACTION, default=False)
+    sdk_publish.add_argument("--skip-push", action=_BOOL_ACTION, default=False)
     sdk_publish.add_argument("--commit-message")
 
+
+def _build_pipeline_parser(subparsers: argparse._SubParsersAction) -> None:
     pipeline_cmd = subparsers.add_parser("pipeline", help="Composite pipeline registry commands")
     pipeline_subparsers = pipeline_cmd.add_subparsers(dest="pipeline_command", required=True)
 
-    pipeline_list = pipeline_subparsers.add_parser("list", help="List registered pipelines")
+    pipeline_subparsers.add_parser("list", help="List registered pipelines")
 
     pipeline_run = pipeline_subparsers.add_parser("run", help="Execute a registered pipeline")
     pipeline_run.add_argument("--pipeline", required=True, dest="pipeline_slug")
     pipeline_run.add_argument("--input", action="append")
-    pipeline_run.add_argument("--workspace-root", default=".")
+    pipeline_run.add_argument("--workspace-root", default=_DEFAULT_WORKSPACE_ROOT)
+
+
+_PARSER_BUILDERS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "cli": _build_cli_parser,
+    "prepare": _build_legacy_prepare_parser,
+    "publish": _build_legacy_publish_parser,
+    "rules": _build_rules_parser,
+    "terminal": _build_terminal_parser,
+    "workflow": _build_workflow_parser,
+    "sdk": _build_sdk_parser,
+    "pipeline": _build_pipeline_parser,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the top-level command in ``argv`` when it can be identified up front."""
+
+    for token in argv:
+        if token in ("-h", "--help"):
+            return None
+        if not token.startswith("-"):
+            return token if token in _PARSER_BUILDERS else None
+    return None
+
+
+def _build_parser(command: str | None) -> argparse.ArgumentParser:
+    """Build the CLI parser, limited to ``command``'s branch when it is known."""
+
+    parser = argparse.ArgumentParser(prog="release-pipeline", description="aware_release orchestration helper")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    if command is None:
+        for builder in _PARSER_BUILDERS.values():
+            builder(subparsers)
+    else:
+        _PARSER_BUILDERS[command](subparsers)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    _load_local_env()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _build_parser(_sniff_subcommand(argv))
 
     args = parser.parse_args(argv)
 
-    if args.command == "cli":
-        if args.cli_command == "prepare":
-            return _run_prepare(args)
-        if args.cli_command == "publish":
-            return _run_publish(args)
-        if args.cli_command == "aware-release" and args.aware_release_command == "publish-pypi":
-            payload = publish_awarerelease_pypi(
-                workspace_root=args.workspace_root,
-                build_dir=args.build_dir,
-                pyproject_path=args.pyproject,
-                repository=args.repository,
-                dry_run=args.dry_run,
-            )
-            print(json.dumps(payload, indent=2))
-            return 0
-
-    if args.command == "sdk":
-        if args.sdk_command == "sync":
-            payload = _sync_sdk_export(
-                export_root=args.export_root,
-                target_root=args.target,
-                dry_run=args.dry_run,
-            )
-            print(json.dumps(payload, indent=2))
-            return 0
-
-        if args.sdk_command == "publish":
-            payload = _publish_sdk_export(
-                workspace_root=args.workspace_root,
-                target_root=args.target,
-                branch=args.branch,
-                skip_versioning=args.skip_versioning,
-                skip_workflow=args.skip_workflow,
-                pipeline_dry_run=args.pipeline_dry_run,
-                skip_push=args.skip_push,
-                commit_message=args.commit_message,
-            )
-            print(json.dumps(payload, indent=2))
-            return 0
-
-    if args.command == "prepare":  # legacy path
-        return _run_prepare(args)
-
-    if args.command == "publish":  # legacy path
-        return _run_publish(args)
-
-    if args.command == "rules":
-        if args.rules_command == "render":
-            payload = render_rules(
-                version=args.version,
-                rules_root=args.rules_root,
-                manifest_path=args.manifest,
-                update_current=args.update_current,
-                workspace_root=args.workspace_root,
-                clean_manifest=not args.keep_manifest,
-            )
-            print(json.dumps(payload.to_dict(), indent=2))
-            return 0
-
-    if args.command == "terminal":
-        if args.terminal_command == "refresh":
-            payload = refresh_terminal_providers(
-                workspace_root=args.workspace_root,
-                manifests_dir=args.manifests_dir,
-            )
-            print(json.dumps(payload.to_dict(), indent=2))
-            return 0
-        if args.terminal_command == "validate":
-            payload = validate_terminal_providers(
-                workspace_root=args.workspace_root,
-                manifests_dir=args.manifests_dir,
-            )
-            print(json.dumps(payload.to_dict(), indent=2))
-            if payload.issues:
-                return 1
-            return 0
-
-    if args.command == "workflow":
-        if args.workflow_command == "list":
-            specs = [spec.model_dump(mode="json") for spec in list_workflows()]
-            print(json.dumps(specs, indent=2))
-            return 0
-
-        if args.workflow_command == "trigger":
-            try:
-                spec = get_workflow(args.workflow_slug)
-            except KeyError as exc:
-                print(str(exc), file=sys.stderr)
-                return 2
-
-            input_values = _parse_key_value_args(args.input or [])
-            try:
-                result = trigger_workflow(
-                    spec,
-                    ref=args.ref,
-                    inputs=input_values,
-                    token_env_override=args.token_env,
-                    dry_run=args.dry_run,
-                    github_api=args.github_api,
-                )
-            except WorkflowTriggerError as exc:
-                print(str(exc), file=sys.stderr)
-                return 2
-
-            print(json.dumps(result.model_dump(mode="json"), indent=2))
-            return 0
-
-    if args.command == "pipeline":
-        if args.pipeline_command == "list":
-            specs = [spec.to_dict() for spec in list_pipeline_specs()]
-            print(json.dumps(specs, indent=2))
-            return 0
-
-        if args.pipeline_command == "run":
-            try:
-                spec = get_pipeline_spec(args.pipeline_slug)
-            except KeyError as exc:
-                print(str(exc), file=sys.stderr)
-                return 2
-
-            try:
-                provided_inputs = _parse_pipeline_inputs(args.input or [])
-            except ValueError as exc:
-                print(str(exc), file=sys.stderr)
-                return 2
-
-            try:
-                resolved_inputs = _resolve_pipeline_inputs(spec, provided_inputs)
-            except ValueError as exc:
-                print(str(exc), file=sys.stderr)
-                return 2
-
-            context = PipelineContext(
-                workspace_root=Path(args.workspace_root).resolve(),
-                inputs=resolved_inputs,
-                raw_inputs=provided_inputs,
-            )
-
-            try:
-                result = spec.runner(context)
-            except PipelineError as exc:
-                print(str(exc), file=sys.stderr)
-                return 2
-
-            payload = {
-                "pipeline": spec.slug,
-                "status": result.status,
-                "artifacts": result.artifacts,
-                "receipts": result.receipts,
-                "logs": result.logs,
-                "next_steps": result.next_steps,
-                "data": result.data,
-            }
-            print(json.dumps(payload, indent=2))
-            return 0
-
-    parser.error("Unknown command")
-    return 1
+    handler = _COMMAND_HANDLERS.get(args.command)
+    exit_code = handler(args) if handler is not None else None
+    if exit_code is None:
+        parser.error("Unknown command")
+    return exit_code
+
+
+def _dispatch(handlers: dict[str, _Handler], name: str | None, args: argparse.Namespace) -> int | None:
+    handler = handlers.get(name) if name is not None else None
+    return handler(args) if handler is not None else None
+
+
+def _dispatch_cli(args: argparse.Namespace) -> int | None:
+    return _dispatch(_CLI_HANDLERS, args.cli_command, args)
+
+
+def _dispatch_aware_release(args: argparse.Namespace) -> int | None:
+    return _dispatch(_AWARE_RELEASE_HANDLERS, args.aware_release_command, args)
+
+
+def _dispatch_sdk(args: argparse.Namespace) -> int | None:
+    return _dispatch(_SDK_HANDLERS, args.sdk_command, args)
+
+
+def _dispatch_rules(args: argparse.Namespace) -> int | None:
+    return _dispatch(_RULES_HANDLERS, args.rules_command, args)
+
+
+def _dispatch_terminal(args: argparse.Namespace) -> int | None:
+    return _dispatch(_TERMINAL_HANDLERS, args.terminal_command, args)
+
+
+def _dispatch_workflow(args: argparse.Namespace) -> int | None:
+    return _dispatch(_WORKFLOW_HANDLERS, args.workflow_command, args)
+
+
+def _dispatch_pipeline(args: argparse.Namespace) -> int | None:
+    return _dispatch(_PIPELINE_HANDLERS, args.pipeline_command, args)
+
+
+def _run_aware_release_publish_pypi(args: argparse.Namespace) -> int:
+    from .pipeline import publish_awarerelease_pypi
+
+    payload = publish_awarerelease_pypi(
+        workspace_root=args.workspace_root,
+        build_dir=args.build_dir,
+        pyproject_path=args.pyproject,
+        repository=args.repository,
+        dry_run=args.dry_run,
+    )
+    _print_json(payload)
+    return 0
+
+
+def _run_sdk_sync(args: argparse.Namespace) -> int:
+    payload = _sync_sdk_export(
+        export_root=args.export_root,
+        target_root=args.target,
+        dry_run=args.dry_run,
+    )
+    _print_json(payload)
+    return 0
+
+
+def _run_sdk_publish(args: argparse.Namespace) -> int:
+    payload = _publish_sdk_export(
+        workspace_root=args.workspace_root,
+        target_root=args.target,
+        branch=args.branch,
+        skip_versioning=args.skip_versioning,
+        skip_workflow=args.skip_workflow,
+        pipeline_dry_run=args.pipeline_dry_run,
+        skip_push=args.skip_push,
+        commit_message=args.commit_message,
+    )
+    _print_json(payload)
+    return 0
+
+
+def _run_rules_render(args: argparse.Namespace) -> int:
+    from .pipeline import render_rules
+
+    payload = render_rules(
+        version=args.version,
+        rules_root=args.rules_root,
+        manifest_path=args.manifest,
+        update_current=args.update_current,
+        workspace_root=args.workspace_root,
+        clean_manifest=not args.keep_manifest,
+    )
+    _print_json(payload.to_dict())
+    return 0
+
+
+def _run_terminal_refresh(args: argparse.Namespace) -> int:
+    from .pipeline import refresh_terminal_providers
+
+    payload = refresh_terminal_providers(
+        workspace_root=args.workspace_root,
+        manifests_dir=args.manifests_dir,
+    )
+    _print_json(payload.to_dict())
+    return 0
+
+
+def _run_terminal_validate(args: argparse.Namespace) -> int:
+    from .pipeline import validate_terminal_providers
+
+    payload = validate_terminal_providers(
+        workspace_root=args.workspace_root,
+        manifests_dir=args.manifests_dir,
+    )
+    has_issues = bool(payload.issues)
+    _print_json(payload.to_dict())
+    return 1 if has_issues else 0
+
+
+def _run_workflow_list(args: argparse.Namespace) -> int:
+    from .workflows import list_workflows_dumped
+
+    _print_json(list_workflows_dumped())
+    return 0
+
+
+def _run_workflow_trigger(args: argparse.Namespace) -> int:
+    from aware_release.workflows import WorkflowTriggerError, trigger_workflow
+
+    from .workflows import get_workflow
+
+    try:
+        spec = get_workflow(args.workflow_slug)
+    except KeyError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    input_values = _parse_key_value_args(args.input)
+    try:
+        result = trigger_workflow(
+            spec,
+            ref=args.ref,
+            inputs=input_values,
+            token_env_override=args.token_env,
+            dry_run=args.dry_run,
+            github_api=args.github_api,
+        )
+    except WorkflowTriggerError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    _print_json(result.model_dump(mode="json"))
+    return 0
+
+
+def _run_pipeline_list(args: argparse.Namespace) -> int:
+    from .pipelines import list_pipelines_dumped
+
+    _print_json(list_pipelines_dumped())
+    return 0
+
+
+def _run_pipeline(args: argparse.Namespace) -> int:
+    from .pipelines import PipelineContext, PipelineError, get_pipeline, resolve_pipeline_inputs
+
+    try:
+        spec = get_pipeline(args.pipeline_slug)
+    except KeyError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    try:
+        provided_inputs = _parse_pipeline_inputs(args.input)
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    try:
+        resolved_inputs = resolve_pipeline_inputs(spec, provided_inputs)
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    context = PipelineContext(
+        workspace_root=Path(args.workspace_root).resolve(),
+        inputs=resolved_inputs,
+        raw_inputs=provided_inputs,
+    )
+
+    try:
+        result = spec.runner(context)
+    except PipelineError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    payload = {
+        "pipeline": spec.slug,
+        "status": result.status,
+        "artifacts": result.artifacts,
+        "receipts": result.receipts,
+        "logs": result.logs,
+        "next_steps": result.next_steps,
+        "data": result.data,
+    }
+    _print_json(payload)
+    return 0
 
 
 def _run_prepare(args: argparse.Namespace) -> int:
+    from .pipeline import prepare_release
+
     payload = prepare_release(
         channel=args.channel,
         version=args.version,
@@ -347,12 +487,14 @@ def _run_prepare(args: argparse.Namespace) -> int:
         python_version=args.python_version,
         workspace_root=args.workspace_root,
     )
-    print(json.dumps(payload.to_dict(), indent=2))
+    _print_json(payload.to_dict())
     return 0
 
 
 def _run_publish(args: argparse.Namespace) -> int:
-    adapter_options = _parse_key_value_args(args.adapter_arg or [])
+    from .pipeline import publish_release
+
+    adapter_options = _parse_key_value_args(args.adapter_arg)
     if args.adapter_command:
         adapter_options["command"] = args.adapter_command
     payload = publish_release(
@@ -370,13 +512,13 @@ def _run_publish(args: argparse.Namespace) -> int:
         actor=args.actor,
         workspace_root=args.workspace_root,
     )
-    print(json.dumps(payload.to_dict(), indent=2))
+    _print_json(payload.to_dict())
     return 0
 
 
-def _sync_sdk_export(*, export_root: str, target_root: str, dry_run: bool) -> Dict[str, object]:
-    export_path = Path(export_root).resolve()
-    target_path = Path(target_root).resolve()
+def _sync_sdk_export(*, export_root: str, target_root: str, dry_run: bool) -> dict[str, object]:
+    export_path = Path(os.path.abspath(export_root))
+    target_path = Path(os.path.abspath(target_root))
 
     if not export_path.is_dir():
         raise FileNotFoundError(f"Export root not found: {export_path}")
@@ -421,10 +563,10 @@ def _sync_sdk_export(*, export_root: str, target_root: str, dry_run: bool) -> Di
     for item in export_path.iterdir():
         destination = target_path / item.name
         if item.is_dir():
-            shutil.copytree(item, destination)
+            shutil.copytree(item, destination, copy_function=clone_file)
         else:
             destination.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, destination)
+            clone_file(str(item), str(destination))
 
     return {
         "status": "synced",
@@ -440,7 +582,9 @@ def _run_sdk_pipeline(
     skip_workflow: bool,
     dry_run: bool,
 ) -> PipelineResult:
-    spec = get_pipeline_spec("sdk-release")
+    from .pipelines import PipelineContext, get_pipeline
+
+    spec = get_pipeline("sdk-release")
     context = PipelineContext(
         workspace_root=workspace_root,
         inputs={
@@ -453,7 +597,7 @@ def _run_sdk_pipeline(
     return spec.runner(context)
 
 
-def _run_git_command(args: List[str], *, cwd: Path, capture_output: bool = False) -> subprocess.CompletedProcess:
+def _run_git_command(args: list[str], *, cwd: Path, capture_output: bool = False) -> subprocess.CompletedProcess:
     return subprocess.run(
         args,
         cwd=str(cwd),
@@ -463,6 +607,11 @@ def _run_git_command(args: List[str], *, cwd: Path, capture_output: bool = False
     )
 
 
+def _git_has_changes(cwd: Path) -> bool:
+    status_proc = _run_git_command(["git", "status", "--porcelain"], cwd=cwd, capture_output=True)
+    return bool(status_proc.stdout.strip())
+
+
 def _publish_sdk_export(
     *,
     workspace_root: str,
@@ -473,7 +622,7 @@ def _publish_sdk_export(
     pipeline_dry_run: bool,
     skip_push: bool,
     commit_message: str | None,
-) -> Dict[str, object]:
+) -> dict[str, object]:
     workspace = Path(workspace_root).resolve()
     target = Path(target_root).resolve()
 
@@ -484,6 +633,8 @@ def _publish_sdk_export(
         dry_run=pipeline_dry_run,
     )
     if pipeline_result.status != "ok":
+        from .pipelines import PipelineError
+
         raise PipelineError("sdk-release pipeline did not complete successfully")
 
     export_root = workspace / "build" / "sdk-export"
@@ -497,8 +648,7 @@ def _publish_sdk_export(
         raise RuntimeError(f"Target path {target} is not a git repository")
 
     _run_git_command(["git", "checkout", branch], cwd=target)
-    status_proc = _run_git_command(["git", "status", "--porcelain"], cwd=target, capture_output=True)
-    if not status_proc.stdout.strip():
+    if not _git_has_changes(target):
         return {
             "status": "skipped",
             "reason": "No changes to commit",
@@ -531,12 +681,14 @@ def _publish_sdk_export(
     }
 
 
-def _parse_pipeline_inputs(values: list[str]) -> Dict[str, List[str]]:
-    inputs: Dict[str, List[str]] = {}
+def _parse_pipeline_inputs(values: list[str] | None) -> dict[str, list[str]]:
+    if not values:
+        return {}
+    inputs: dict[str, list[str]] = {}
     for entry in values:
-        if "=" not in entry:
+        key, sep, raw_value = entry.partition("=")
+        if not sep:
             raise ValueError(f"Pipeline input must be key=value (got '{entry}')")
-        key, raw_value = entry.split("=", 1)
         key = key.strip()
         if not key:
             raise ValueError("Pipeline input key cannot be empty.")
@@ -544,45 +696,57 @@ def _parse_pipeline_inputs(values: list[str]) -> Dict[str, List[str]]:
     return inputs
 
 
-def _resolve_pipeline_inputs(spec: PipelineSpec, provided: Dict[str, List[str]]) -> Dict[str, object]:
-    resolved: Dict[str, object] = {}
-    for name, input_spec in spec.inputs.items():
-        values = provided.get(name, [])
-        if input_spec.multiple:
-            if values:
-                resolved[name] = [value for value in values if value]
-            elif input_spec.default is not None:
-                default = input_spec.default
-                if isinstance(default, (list, tuple)):
-                    resolved[name] = [str(item) for item in default]
-                else:
-                    resolved[name] = [str(default)]
-            elif input_spec.required:
-                raise ValueError(f"Missing required pipeline input '{name}' for '{spec.slug}'.")
-            else:
-                resolved[name] = []
-        else:
-            value = values[-1] if values else input_spec.default
-            if value is None and input_spec.required:
-                raise ValueError(f"Missing required pipeline input '{name}' for '{spec.slug}'.")
-            resolved[name] = value
-
-    for name, values in provided.items():
-        if name not in resolved:
-            resolved[name] = values if len(values) != 1 else values[0]
-
-    return resolved
-
-
-def _parse_key_value_args(values: list[str]) -> dict[str, object]:
+def _parse_key_value_args(values: list[str] | None) -> dict[str, object]:
+    if not values:
+        return {}
     options: dict[str, object] = {}
     for entry in values:
-        if "=" not in entry:
+        key, sep, raw_value = entry.partition("=")
+        if not sep:
             raise ValueError(f"Argument must be key=value (got '{entry}')")
-        key, raw_value = entry.split("=", 1)
         options[key.strip()] = raw_value.strip()
     return options
 
 
+_CLI_HANDLERS: dict[str, _Handler] = {
+    "prepare": _run_prepare,
+    "publish": _run_publish,
+    "aware-release": _dispatch_aware_release,
+}
+_AWARE_RELEASE_HANDLERS: dict[str, _Handler] = {
+    "publish-pypi": _run_aware_release_publish_pypi,
+}
+_SDK_HANDLERS: dict[str, _Handler] = {
+    "sync": _run_sdk_sync,
+    "publish": _run_sdk_publish,
+}
+_RULES_HANDLERS: dict[str, _Handler] = {
+    "render": _run_rules_render,
+}
+_TERMINAL_HANDLERS: dict[str, _Handler] = {
+    "refresh": _run_terminal_refresh,
+    "validate": _run_terminal_validate,
+}
+_WORKFLOW_HANDLERS: dict[str, _Handler] = {
+    "list": _run_workflow_list,
+    "trigger": _run_workflow_trigger,
+}
+_PIPELINE_HANDLERS: dict[str, _Handler] = {
+    "list": _run_pipeline_list,
+    "run": _run_pipeline,
+}
+# "prepare"/"publish" at the top level are the legacy aliases for "cli prepare"/"cli publish".
+_COMMAND_HANDLERS: dict[str, _Handler] = {
+    "cli": _dispatch_cli,
+    "sdk": _dispatch_sdk,
+    "prepare": _run_prepare,
+    "publish": _run_publish,
+    "rules": _dispatch_rules,
+    "terminal": _dispatch_terminal,
+    "workflow": _dispatch_workflow,
+    "pipeline": _dispatch_pipeline,
+}
+
+
 if __name__ == "__main__":  # pragma: no cover
     sys.exit(main())
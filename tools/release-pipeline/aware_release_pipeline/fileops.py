@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+
+_FICLONE = 0x40049409
+# errnos meaning "this filesystem/kernel can't do that", as opposed to real I/O failures.
+_UNSUPPORTED_ERRNOS = frozenset(
+    code
+    for code in (
+        getattr(errno, "EXDEV", None),
+        getattr(errno, "ENOSYS", None),
+        getattr(errno, "EINVAL", None),
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "ENOTTY", None),
+        getattr(errno, "EBADF", None),
+        getattr(errno, "EPERM", None),
+    )
+    if code is not None
+)
+
+_reflink_supported: bool | None = None
+_copy_range_supported: bool | None = None
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """Clone ``src`` into ``dst`` via FICLONE; returns False when unsupported."""
+
+    global _reflink_supported
+    if _reflink_supported is False:
+        return False
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - non-POSIX platforms
+        _reflink_supported = False
+        return False
+    try:
+        with open(src, "rb") as src_handle, open(dst, "wb") as dst_handle:
+            fcntl.ioctl(dst_handle.fileno(), _FICLONE, src_handle.fileno())
+    except OSError as exc:
+        if exc.errno not in _UNSUPPORTED_ERRNOS:
+            raise
+        if _reflink_supported is None:
+            _reflink_supported = False
+        return False
+    _reflink_supported = True
+    return True
+
+
+def _copy_range(src: str, dst: str) -> bool:
+    """Copy via ``copy_file_range`` so the kernel can share extents or copy server-side."""
+
+    global _copy_range_supported
+    if _copy_range_supported is False or not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as src_handle, open(dst, "wb") as dst_handle:
+        remaining = os.fstat(src_handle.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_handle.fileno(), dst_handle.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError as exc:
+            if exc.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            if _copy_range_supported is None:
+                _copy_range_supported = False
+            return False
+    if remaining > 0:
+        return False  # short copy (source shrank or EOF early); let copy2 redo the whole file
+    _copy_range_supported = True
+    return True
+
+
+def clone_file(src: str, dst: str) -> str:
+    """Copy ``src`` to ``dst`` with metadata, preferring CoW clones over copying bytes."""
+
+    if _reflink(src, dst) or _copy_range(src, dst):
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+    return dst
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from functools import partial
+
+_utc_now = partial(datetime.now, timezone.utc)
 
 
 @dataclass(slots=True)
 class CliPrepareResult:
     archive_path: str
     manifest_path: str
-    manifest: Dict[str, object]
-    lock_path: Optional[str] = None
+    manifest: dict[str, object]
+    lock_path: str | None = None
 
-    def to_dict(self) -> Dict[str, object]:
-        payload: Dict[str, object] = {
+    def to_dict(self) -> dict[str, object]:
+        payload: dict[str, object] = {
             "archive_path": self.archive_path,
             "manifest_path": self.manifest_path,
             "manifest": self.manifest,
@@ -27,11 +29,11 @@ class CliPrepareResult:
 class CliPublishUpload:
     adapter: str
     status: str
-    url: Optional[str]
-    details: Dict[str, object]
-    logs: List[str] = field(default_factory=list)
+    url: str | None
+    details: dict[str, object]
+    logs: list[str] = field(default_factory=list)
 
-    def to_dict(self) -> Dict[str, object]:
+    def to_dict(self) -> dict[str, object]:
         return {
             "adapter": self.adapter,
             "status": self.status,
@@ -46,14 +48,14 @@ class CliPublishResult:
     manifest_path: str
     archive_path: str
     checksum_match: bool
-    index_path: Optional[str]
+    index_path: str | None
     index_updated: bool
-    signature_path: Optional[str]
+    signature_path: str | None
     upload: CliPublishUpload
-    logs: List[str]
-    next_steps: List[str]
-    metadata: Dict[str, object]
-    def to_dict(self) -> Dict[str, object]:
+    logs: list[str]
+    next_steps: list[str]
+    metadata: dict[str, object]
+    def to_dict(self) -> dict[str, object]:
         return {
             "manifest_path": self.manifest_path,
             "archive_path": self.archive_path,
@@ -73,10 +75,10 @@ class RulesRenderResult:
     cli_version: str
     rules_root: str
     manifest_path: str
-    rules: List[str]
+    rules: list[str]
     update_current: str
 
-    def to_dict(self) -> Dict[str, object]:
+    def to_dict(self) -> dict[str, object]:
         return {
             "cli_version": self.cli_version,
             "rules_root": self.rules_root,
@@ -88,12 +90,12 @@ class RulesRenderResult:
 
 @dataclass(slots=True)
 class ProviderRefreshResult:
-    manifest_paths: List[str]
-    providers_changed: List[str]
+    manifest_paths: list[str]
+    providers_changed: list[str]
     timestamp: datetime
-    logs: List[str] = field(default_factory=list)
+    logs: list[str] = field(default_factory=list)
 
-    def to_dict(self) -> Dict[str, object]:
+    def to_dict(self) -> dict[str, object]:
         return {
             "manifest_paths": self.manifest_paths,
             "providers_changed": self.providers_changed,
@@ -108,7 +110,7 @@ class ProviderValidationIssue:
     message: str
     level: str = "error"
 
-    def to_dict(self) -> Dict[str, object]:
+    def to_dict(self) -> dict[str, object]:
         return {
             "manifest": self.manifest,
             "message": self.message,
@@ -118,11 +120,11 @@ class ProviderValidationIssue:
 
 @dataclass(slots=True)
 class ProviderValidationResult:
-    manifest_paths: List[str]
-    issues: List[ProviderValidationIssue] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    manifest_paths: list[str]
+    issues: list[ProviderValidationIssue] = field(default_factory=list)
+    timestamp: datetime = field(default_factory=_utc_now)
 
-    def to_dict(self) -> Dict[str, object]:
+    def to_dict(self) -> dict[str, object]:
         return {
             "manifest_paths": self.manifest_paths,
             "issues": [issue.to_dict() for issue in self.issues],
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
 import sys
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
 from .models import (
     CliPrepareResult,
@@ -15,6 +19,11 @@ from .models import (
     RulesRenderResult,
 )
 
+try:  # Optional accelerator; stdlib json parses the same documents.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the environment
+    _json_loads = json.loads
+
 
 def prepare_release(
     *,
@@ -34,29 +43,23 @@ def prepare_release(
 ) -> CliPrepareResult:
     """Bundle wheels + manifest and optionally produce lockfiles."""
 
-    workspace = Path(workspace_root).resolve()
-    wheel_paths = [Path(w) if Path(w).is_absolute() else workspace / w for w in wheels]
+    workspace = _resolve_workspace(workspace_root)
+    wheel_paths = [_workspace_path(workspace, w) for w in wheels]
     provider_candidates: List[Path] = []
     for entry in providers_dir or []:
-        candidate = Path(entry)
-        provider_candidates.append(candidate if candidate.is_absolute() else workspace / candidate)
+        provider_candidates.append(_workspace_path(workspace, entry))
     for entry in provider_wheels or []:
-        candidate = Path(entry)
-        provider_candidates.append(candidate if candidate.is_absolute() else workspace / candidate)
+        provider_candidates.append(_workspace_path(workspace, entry))
 
     providers, provider_artifacts = _collect_providers(provider_candidates)
 
     overrides = _parse_overrides(manifest_overrides)
     dependencies = _read_dependencies(workspace / dependencies_file) if dependencies_file else None
 
-    output = Path(output_dir)
-    if not output.is_absolute():
-        output = workspace / output
+    output = _workspace_path(workspace, output_dir)
 
     from aware_release.bundle.builder import BundleBuilder, BundleConfig
-    from aware_release.bundle.locks import LockRequest, generate_lock
     from aware_release.bundle.manifest import load_manifest
-    from aware_release.bundle.provider import discover_providers
 
     builder = BundleBuilder(workspace_root=workspace)
     config = BundleConfig(
@@ -77,9 +80,9 @@ def prepare_release(
 
     lock_path = None
     if generate_lockfile:
-        lock_output_path = Path(lock_output) if lock_output else output / "locks" / f"{platform}.txt"
-        if not lock_output_path.is_absolute():
-            lock_output_path = workspace / lock_output_path
+        from aware_release.bundle.locks import LockRequest, generate_lock
+
+        lock_output_path = _workspace_path(workspace, lock_output or output / "locks" / f"{platform}.txt")
         request = LockRequest(
             requirements=manifest.dependencies,
             platform=platform,
@@ -105,15 +108,11 @@ def render_rules(
     workspace_root: str | Path = ".",
     clean_manifest: bool = True,
 ) -> RulesRenderResult:
-    workspace = Path(workspace_root).resolve()
+    workspace = _resolve_workspace(workspace_root)
 
-    resolved_rules_root = Path(rules_root)
-    if not resolved_rules_root.is_absolute():
-        resolved_rules_root = workspace / resolved_rules_root
+    resolved_rules_root = _workspace_path(workspace, rules_root)
 
-    resolved_manifest = Path(manifest_path)
-    if not resolved_manifest.is_absolute():
-        resolved_manifest = workspace / resolved_manifest
+    resolved_manifest = _workspace_path(workspace, manifest_path)
     resolved_manifest.parent.mkdir(parents=True, exist_ok=True)
     if clean_manifest and resolved_manifest.exists():
         resolved_manifest.unlink()
@@ -145,7 +144,8 @@ def render_rules(
         cli_version,
     ]
     for rule_id in rule_ids:
-        args += ["--rule", rule_id]
+        args.append("--rule")
+        args.append(rule_id)
 
     exit_code = aware_cli_main(args)
     if exit_code != 0:
@@ -176,10 +176,8 @@ def publish_release(
     actor: Optional[str] = None,
     workspace_root: str | Path = ".",
 ) -> CliPublishResult:
-    workspace = Path(workspace_root).resolve()
-    output = Path(output_dir)
-    if not output.is_absolute():
-        output = workspace / output
+    workspace = _resolve_workspace(workspace_root)
+    output = _workspace_path(workspace, output_dir)
 
     base_dir = output / channel / version / platform
     manifest_path = base_dir / "manifest.json"
@@ -231,10 +229,8 @@ def refresh_terminal_providers(
     workspace_root: str | Path = ".",
     manifests_dir: str | Path = "libs/providers/terminal/aware_terminal_providers/providers",
 ) -> ProviderRefreshResult:
-    workspace = Path(workspace_root).resolve()
-    manifests_root = Path(manifests_dir)
-    if not manifests_root.is_absolute():
-        manifests_root = workspace / manifests_root
+    workspace = _resolve_workspace(workspace_root)
+    manifests_root = _workspace_path(workspace, manifests_dir)
 
     logs: List[str] = []
     manifest_paths: List[str] = []
@@ -245,183 +241,213 @@ def refresh_terminal_providers(
     if not updater.exists():
         raise FileNotFoundError(f"Provider updater script not found: {updater}")
 
-    import subprocess
-
-    proc = subprocess.run(
-        [
-            sys.executable,
-            str(updater),
-            "--write",
-            "--verbose",
-        ],
-        cwd=str(scripts_dir),
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    logs.append(proc.stdout)
-    if proc.stderr:
-        logs.append(proc.stderr)
-    if proc.returncode != 0:
-        raise RuntimeError(f"Provider manifest refresh failed with exit code {proc.returncode}: {proc.stderr.strip()}")
+    returncode, stdout, stderr = _run_captured([sys.executable, str(updater), "--write", "--verbose"], cwd=scripts_dir)
+    logs.append(stdout)
+    if stderr:
+        logs.append(stderr)
+    if returncode != 0:
+        raise RuntimeError(f"Provider manifest refresh failed with exit code {returncode}: {stderr.strip()}")
 
-    for manifest_path in manifests_root.glob("*/releases.json"):
+    for manifest_path in _iter_release_manifests(manifests_root):
         manifest_paths.append(str(manifest_path))
         providers_changed.append(manifest_path.parent.name)
 
-    from datetime import datetime
-
     return ProviderRefreshResult(
         manifest_paths=manifest_paths,
         providers_changed=providers_changed,
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
         logs=logs,
     )
 
 
-def validate_terminal_providers(
-    *,
-    workspace_root: str | Path = ".",
-    manifests_dir: str | Path = "libs/providers/terminal/aware_terminal_providers/providers",
-) -> ProviderValidationResult:
-    workspace = Path(workspace_root).resolve()
-    manifests_root = Path(manifests_dir)
-    if not manifests_root.is_absolute():
-        manifests_root = workspace / manifests_root
+def _iter_release_manifests(root: Path) -> Iterator[Path]:
+    """Yield ``<provider>/releases.json`` under *root* using a single directory scan."""
+
+    try:
+        entries = os.scandir(root)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    with entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            candidate = os.path.join(entry.path, "releases.json")
+            if os.path.isfile(candidate):
+                yield Path(candidate)
 
-    manifest_paths = sorted(str(path) for path in manifests_root.glob("*/releases.json"))
-    issues: List[ProviderValidationIssue] = []
 
-    import json as _json
+def _run_captured(args: List[str], *, cwd: Optional[Path] = None) -> tuple[int, str, str]:
+    """Run *args* with piped output, decoding each stream once and tolerating non-UTF-8 bytes."""
 
-    def _validate_versions_schema(manifest_path: Path, payload: dict, issues: List[ProviderValidationIssue]) -> None:
-        versions = payload.get("versions", [])
-        if not isinstance(versions, list):
+    proc = subprocess.Popen(
+        args,
+        cwd=str(cwd) if cwd is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, stderr = proc.communicate()
+    return proc.returncode, stdout.decode("utf-8", "replace"), stderr.decode("utf-8", "replace")
+
+
+def _validate_versions_schema(manifest_path: Path, payload: dict, issues: List[ProviderValidationIssue]) -> None:
+    manifest = str(manifest_path)
+    versions = payload.get("versions", [])
+    if not isinstance(versions, list):
+        issues.append(
+            ProviderValidationIssue(
+                manifest=manifest,
+                message="'versions' must be a list.",
+            )
+        )
+        return
+
+    seen_tags: Dict[str, str] = {}
+    for entry in versions:
+        if not isinstance(entry, dict):
             issues.append(
                 ProviderValidationIssue(
-                    manifest=str(manifest_path),
-                    message="'versions' must be a list.",
+                    manifest=manifest,
+                    message="Version entry must be an object.",
                 )
             )
-            return
-
-        seen_tags: Dict[str, str] = {}
-        for entry in versions:
-            if not isinstance(entry, dict):
-                issues.append(
-                    ProviderValidationIssue(
-                        manifest=str(manifest_path),
-                        message="Version entry must be an object.",
-                    )
-                )
-                continue
-            tag = entry.get("tag")
-            version = entry.get("version")
-            if not tag or not version:
-                issues.append(
-                    ProviderValidationIssue(
-                        manifest=str(manifest_path),
-                        message="Version entry missing 'tag' or 'version'.",
-                    )
-                )
-                continue
-            if tag in seen_tags and seen_tags[tag] != version:
-                issues.append(
-                    ProviderValidationIssue(
-                        manifest=str(manifest_path),
-                        message=f"Tag '{tag}' mapped to conflicting versions ({seen_tags[tag]} vs {version}).",
-                    )
+            continue
+        tag = entry.get("tag")
+        version = entry.get("version")
+        if not tag or not version:
+            issues.append(
+                ProviderValidationIssue(
+                    manifest=manifest,
+                    message="Version entry missing 'tag' or 'version'.",
                 )
-            else:
-                seen_tags[tag] = version
-
-    def _validate_channels_schema(manifest_path: Path, payload: dict, issues: List[ProviderValidationIssue]) -> None:
-        channels = payload.get("channels")
-        if not isinstance(channels, dict) or not channels:
+            )
+            continue
+        if tag in seen_tags and seen_tags[tag] != version:
             issues.append(
                 ProviderValidationIssue(
-                    manifest=str(manifest_path),
-                    message="Manifest 'channels' must be a non-empty object.",
+                    manifest=manifest,
+                    message=f"Tag '{tag}' mapped to conflicting versions ({seen_tags[tag]} vs {version}).",
                 )
             )
-            return
+        else:
+            seen_tags[tag] = version
 
-        for channel_name, channel_data in channels.items():
-            if not isinstance(channel_data, dict):
-                issues.append(
-                    ProviderValidationIssue(
-                        manifest=str(manifest_path),
-                        message=f"Channel '{channel_name}' entry must be an object.",
-                    )
-                )
-                continue
-            version = channel_data.get("version")
-            if not isinstance(version, str) or not version.strip():
-                issues.append(
-                    ProviderValidationIssue(
-                        manifest=str(manifest_path),
-                        message=f"Channel '{channel_name}' missing string 'version'.",
-                    )
-                )
-            npm_tag = channel_data.get("npm_tag")
-            if npm_tag is not None and not isinstance(npm_tag, str):
-                issues.append(
-                    ProviderValidationIssue(
-                        manifest=str(manifest_path),
-                        message=f"Channel '{channel_name}' has non-string 'npm_tag'.",
-                    )
-                )
-            release_notes = channel_data.get("release_notes")
-            if release_notes is not None and not isinstance(release_notes, dict):
-                issues.append(
-                    ProviderValidationIssue(
-                        manifest=str(manifest_path),
-                        message=f"Channel '{channel_name}' has invalid 'release_notes' type (expected object).",
-                    )
-                )
-            if isinstance(release_notes, dict):
-                summary = release_notes.get("summary")
-                if summary is not None and not isinstance(summary, str):
-                    issues.append(
-                        ProviderValidationIssue(
-                            manifest=str(manifest_path),
-                            message=f"Channel '{channel_name}' release notes 'summary' must be a string if present.",
-                        )
-                    )
 
-    for manifest_path_str in manifest_paths:
-        manifest_path = Path(manifest_path_str)
-        try:
-            data = _json.loads(manifest_path.read_text(encoding="utf-8"))
-        except Exception as exc:  # pragma: no cover - reported via validation
+def _validate_channels_schema(manifest_path: Path, payload: dict, issues: List[ProviderValidationIssue]) -> None:
+    manifest = str(manifest_path)
+    channels = payload.get("channels")
+    if not isinstance(channels, dict) or not channels:
+        issues.append(
+            ProviderValidationIssue(
+                manifest=manifest,
+                message="Manifest 'channels' must be a non-empty object.",
+            )
+        )
+        return
+
+    for channel_name, channel_data in channels.items():
+        if not isinstance(channel_data, dict):
             issues.append(
                 ProviderValidationIssue(
-                    manifest=str(manifest_path),
-                    message=f"Failed to parse manifest: {exc}",
+                    manifest=manifest,
+                    message=f"Channel '{channel_name}' entry must be an object.",
                 )
             )
             continue
-
-        if not isinstance(data, dict):
+        version = channel_data.get("version")
+        if not isinstance(version, str) or not version.strip():
             issues.append(
                 ProviderValidationIssue(
-                    manifest=str(manifest_path),
-                    message="Manifest must be a JSON object.",
+                    manifest=manifest,
+                    message=f"Channel '{channel_name}' missing string 'version'.",
                 )
             )
-            continue
-
-        if "versions" in data:
-            _validate_versions_schema(manifest_path, data, issues)
-        elif "channels" in data:
-            _validate_channels_schema(manifest_path, data, issues)
-        else:
+        npm_tag = channel_data.get("npm_tag")
+        if npm_tag is not None and not isinstance(npm_tag, str):
             issues.append(
                 ProviderValidationIssue(
-                    manifest=str(manifest_path),
-                    message="Manifest missing supported schema ('versions' or 'channels').",
+                    manifest=manifest,
+                    message=f"Channel '{channel_name}' has non-string 'npm_tag'.",
+                )
+            )
+        release_notes = channel_data.get("release_notes")
+        if release_notes is not None and not isinstance(release_notes, dict):
+            issues.append(
+                ProviderValidationIssue(
+                    manifest=manifest,
+                    message=f"Channel '{channel_name}' has invalid 'release_notes' type (expected object).",
+                )
+            )
+        if isinstance(release_notes, dict):
+            summary = release_notes.get("summary")
+            if summary is not None and not isinstance(summary, str):
+                issues.append(
+                    ProviderValidationIssue(
+                        manifest=manifest,
+                        message=f"Channel '{channel_name}' release notes 'summary' must be a string if present.",
+                    )
                 )
+
+
+def _validate_provider_manifest(manifest_path_str: str) -> List[ProviderValidationIssue]:
+    manifest_path = Path(manifest_path_str)
+    manifest = manifest_path_str
+    found: List[ProviderValidationIssue] = []
+    try:
+        data = _read_json(manifest_path)
+    except Exception as exc:  # pragma: no cover - reported via validation
+        found.append(
+            ProviderValidationIssue(
+                manifest=manifest,
+                message=f"Failed to parse manifest: {exc}",
             )
+        )
+        return found
+
+    if not isinstance(data, dict):
+        found.append(
+            ProviderValidationIssue(
+                manifest=manifest,
+                message="Manifest must be a JSON object.",
+            )
+        )
+        return found
+
+    if "versions" in data:
+        _validate_versions_schema(manifest_path, data, found)
+    elif "channels" in data:
+        _validate_channels_schema(manifest_path, data, found)
+    else:
+        found.append(
+            ProviderValidationIssue(
+                manifest=manifest,
+                message="Manifest missing supported schema ('versions' or 'channels').",
+            )
+        )
+    return found
+
+
+def validate_terminal_providers(
+    *,
+    workspace_root: str | Path = ".",
+    manifests_dir: str | Path = "libs/providers/terminal/aware_terminal_providers/providers",
+) -> ProviderValidationResult:
+    workspace = _resolve_workspace(workspace_root)
+    manifests_root = _workspace_path(workspace, manifests_dir)
+
+    manifest_paths = sorted(str(path) for path in _iter_release_manifests(manifests_root))
+    issues: List[ProviderValidationIssue] = []
+
+    # Manifests are independent files, so read and check them concurrently;
+    # map() keeps the per-manifest results in sorted path order.
+    if len(manifest_paths) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(32, len(manifest_paths))) as executor:
+            results = list(executor.map(_validate_provider_manifest, manifest_paths))
+    else:
+        results = [_validate_provider_manifest(path) for path in manifest_paths]
+    for found in results:
+        issues.extend(found)
 
     return ProviderValidationResult(
         manifest_paths=manifest_paths,
@@ -429,28 +455,71 @@ def validate_terminal_providers(
     )
 
 
+@lru_cache(maxsize=16)
+def _resolve_absolute(path: str) -> Path:
+    return Path(path).resolve()
+
+
+def _resolve_workspace(workspace_root: str | Path) -> Path:
+    """Resolve a workspace root, memoising the realpath walk for repeat calls in one process."""
+
+    raw = os.fspath(workspace_root)
+    if not os.path.isabs(raw):
+        # Relative roots depend on the cwd, so key the cache on the joined path.
+        raw = os.path.join(os.getcwd(), raw)
+    return _resolve_absolute(raw)
+
+
+def _workspace_path(workspace: Path, path: str | Path) -> Path:
+    """Anchor a relative *path* at *workspace*; absolute paths pass through."""
+
+    raw = os.fspath(path)
+    return Path(raw) if os.path.isabs(raw) else workspace / raw
+
+
+@lru_cache(maxsize=256)
+def _parse_json_bytes(payload: bytes) -> object:
+    return _json_loads(payload)
+
+
+def _read_json(path: Path) -> object:
+    """Parse a JSON file, reusing the previous result while its bytes are unchanged.
+
+    Keyed on content rather than mtime, so an in-place rewrite is never missed. The returned
+    object is shared between callers and must be treated as read-only.
+    """
+
+    with open(path, "rb") as handle:
+        return _parse_json_bytes(handle.read())
+
+
 def _collect_providers(paths: Iterable[Path]) -> tuple[Dict[str, Dict[str, object]], List]:
     from aware_release.bundle.provider import discover_providers
 
     artifacts = discover_providers(paths)
-    providers: Dict[str, Dict[str, object]] = {}
-    for artifact in artifacts:
-        providers[artifact.slug] = {
+    # discover_providers builds a fresh metadata dict per artifact and the bundle
+    # builder re-validates the payload, so there is nothing to copy defensively.
+    providers: Dict[str, Dict[str, object]] = {
+        artifact.slug: {
             "version": artifact.version,
             "source": artifact.source.name,
-            "metadata": dict(artifact.metadata),
+            "metadata": artifact.metadata,
         }
+        for artifact in artifacts
+    }
     return providers, artifacts
 
 
 def _read_dependencies(path: Path) -> List[str]:
     if not path.exists():
         raise FileNotFoundError(f"Dependencies file not found: {path}")
-    return [
-        line.strip()
-        for line in path.read_text(encoding="utf-8").splitlines()
-        if line.strip() and not line.strip().startswith("#")
-    ]
+    dependencies: List[str] = []
+    with path.open("r", encoding="utf-8") as handle:
+        for raw in handle:
+            line = raw.strip()
+            if line and line[0] != "#":
+                dependencies.append(line)
+    return dependencies
 
 
 def _parse_overrides(values: Optional[Sequence[str]]) -> Dict[str, object]:
@@ -458,9 +527,9 @@ def _parse_overrides(values: Optional[Sequence[str]]) -> Dict[str, object]:
     if not values:
         return overrides
     for entry in values:
-        if "=" not in entry:
+        key, sep, raw_value = entry.partition("=")
+        if not sep:
             raise ValueError(f"Manifest override must be key=value (got '{entry}')")
-        key, raw_value = entry.split("=", 1)
         overrides[key.strip()] = raw_value.strip()
     return overrides
 
@@ -487,16 +556,12 @@ def publish_awarerelease_pypi(
     repository: str = "pypi",
     dry_run: bool = False,
 ) -> Dict[str, object]:
-    workspace = Path(workspace_root).resolve()
-    build_dir_path = Path(build_dir) if Path(build_dir).is_absolute() else workspace / build_dir
-    pyproject = Path(pyproject_path)
-    if not pyproject.is_absolute():
-        pyproject = workspace / pyproject
+    workspace = _resolve_workspace(workspace_root)
+    build_dir_path = _workspace_path(workspace, build_dir)
+    pyproject = _workspace_path(workspace, pyproject_path)
     if not pyproject.exists():
         raise FileNotFoundError(f"pyproject not found: {pyproject}")
 
-    import subprocess
-
     build_cmd = [
         "uv",
         "build",
@@ -518,31 +583,32 @@ def publish_awarerelease_pypi(
         publish_cmd.append("--dry-run")
     logs: List[str] = []
 
-    build_result = subprocess.run(build_cmd, capture_output=True, text=True, check=False)
-    logs.extend([build_result.stdout, build_result.stderr])
-    if build_result.returncode != 0:
-        raise RuntimeError(f"uv build failed: {build_result.stderr.strip()}")
+    returncode, stdout, stderr = _run_captured(build_cmd)
+    logs.extend([stdout, stderr])
+    if returncode != 0:
+        raise RuntimeError(f"uv build failed: {stderr.strip()}")
 
     wheels = sorted(build_dir_path.glob("*.whl"))
     if not wheels:
         raise RuntimeError(f"No wheel artifacts found in {build_dir_path}")
 
-    publish_args = publish_cmd + [str(path) for path in wheels]
+    wheel_strs = [str(path) for path in wheels]
+    publish_args = publish_cmd + wheel_strs
 
     if dry_run:
         return {
-            "built": sorted(str(path) for path in build_dir_path.glob("*.whl")),
+            "built": wheel_strs,
             "logs": logs,
             "published": False,
         }
 
-    publish_result = subprocess.run(publish_args, capture_output=True, text=True, check=False)
-    logs.extend([publish_result.stdout, publish_result.stderr])
-    if publish_result.returncode != 0:
-        raise RuntimeError(f"uv publish failed: {publish_result.stderr.strip()}")
+    returncode, stdout, stderr = _run_captured(publish_args)
+    logs.extend([stdout, stderr])
+    if returncode != 0:
+        raise RuntimeError(f"uv publish failed: {stderr.strip()}")
 
     return {
-        "built": sorted(str(path) for path in build_dir_path.glob("*.whl")),
+        "built": wheel_strs,
         "logs": logs,
         "published": True,
         "repository": repository,
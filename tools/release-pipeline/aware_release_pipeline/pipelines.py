@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import os
 import shutil
+import stat
 import subprocess
+import threading
+from collections import ChainMap, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import IO, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional
 
+from .fileops import clone_file
 from .pipeline import (
     prepare_release,
     publish_awarerelease_pypi,
@@ -17,14 +23,13 @@ from .pipeline import (
 )
 from .versioning import (
     VersionConfig,
+    apply_version_bump,
     bump_version,
     read_version,
-    update_changelog,
-    write_version,
 )
-from .workflows import get_workflow
-from aware_release.workflows import WorkflowTriggerError, trigger_workflow
 
+# aware_release.workflows (requests + pydantic) is imported inside the runners that
+# dispatch workflows so listing or resolving pipeline specs stays cheap.
 
 SDK_EXPORT_BASE_DIRS = ["aware_sdk", "tests", ".github"]
 SDK_EXPORT_BASE_FILES = [".gitignore", "pyproject.toml", "README.md", "CHANGELOG.md", "LICENSE", "uv.lock"]
@@ -43,7 +48,7 @@ class PipelineError(RuntimeError):
     """Raised when a pipeline execution fails validation or runtime checks."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineInputSpec:
     description: Optional[str] = None
     default: Optional[object] = None
@@ -61,7 +66,7 @@ class PipelineInputSpec:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineSpec:
     slug: str
     description: str
@@ -69,6 +74,11 @@ class PipelineSpec:
     inputs: Dict[str, PipelineInputSpec] = field(default_factory=dict)
     artifacts: List[str] = field(default_factory=list)
     receipts: List[str] = field(default_factory=list)
+    # (name, multiple, required, default) rows with defaults pre-normalised, compiled on first
+    # resolve so that resolving inputs for a run is a flat loop over constants.
+    _input_plan: Optional[tuple[tuple[str, bool, bool, object], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -80,11 +90,19 @@ class PipelineSpec:
         }
 
 
-@dataclass
+def _environ_snapshot() -> Mapping[str, str]:
+    """Read-only copy of ``os.environ``; copying it again later is a single C-level dict copy."""
+
+    return MappingProxyType(dict(os.environ))
+
+
+@dataclass(slots=True)
 class PipelineContext:
     workspace_root: Path
-    inputs: Dict[str, object]
+    inputs: MutableMapping[str, object]
     raw_inputs: Dict[str, List[str]]
+    # Taken when the run starts (after the CLI has loaded .env) and shared by all of its subprocesses.
+    base_env: Mapping[str, str] = field(default_factory=_environ_snapshot, repr=False, compare=False)
 
     def get(self, name: str, default: Optional[object] = None) -> Optional[object]:
         return self.inputs.get(name, default)
@@ -98,7 +116,7 @@ class PipelineContext:
         return [str(value)]
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     status: str = "ok"
     artifacts: Dict[str, object] = field(default_factory=dict)
@@ -119,12 +137,29 @@ class PipelineResult:
 
 
 _PIPELINES: Dict[str, PipelineSpec] = {}
+_PIPELINE_DICTS: Optional[tuple[dict[str, object], ...]] = None
+
+
+def _input_plan(spec: PipelineSpec) -> tuple[tuple[str, bool, bool, object], ...]:
+    plan = spec._input_plan
+    if plan is None:
+        rows = []
+        for name, input_spec in spec.inputs.items():
+            default = input_spec.default
+            if input_spec.multiple and default is not None:
+                default = tuple(map(str, default)) if isinstance(default, (list, tuple)) else (str(default),)
+            rows.append((name, input_spec.multiple, input_spec.required, default))
+        plan = tuple(rows)
+        object.__setattr__(spec, "_input_plan", plan)
+    return plan
 
 
 def register_pipeline(spec: PipelineSpec) -> None:
+    global _PIPELINE_DICTS
     if spec.slug in _PIPELINES:
         raise ValueError(f"Pipeline '{spec.slug}' already registered.")
     _PIPELINES[spec.slug] = spec
+    _PIPELINE_DICTS = None
 
 
 def get_pipeline(slug: str) -> PipelineSpec:
@@ -139,6 +174,43 @@ def list_pipelines() -> Iterable[PipelineSpec]:
     return _PIPELINES.values()
 
 
+def resolve_pipeline_inputs(spec: PipelineSpec, provided: Dict[str, List[str]]) -> Dict[str, object]:
+    resolved: Dict[str, object] = {}
+    for name, multiple, required, default in _input_plan(spec):
+        values = provided.get(name)
+        if multiple:
+            if values:
+                resolved[name] = [value for value in values if value]
+            elif default is not None:
+                resolved[name] = list(default)
+            elif required:
+                raise ValueError(f"Missing required pipeline input '{name}' for '{spec.slug}'.")
+            else:
+                resolved[name] = []
+        else:
+            value = values[-1] if values else default
+            if value is None and required:
+                raise ValueError(f"Missing required pipeline input '{name}' for '{spec.slug}'.")
+            resolved[name] = value
+
+    # Every declared input was resolved above, so only undeclared extras remain.
+    spec_inputs = spec.inputs
+    for name, values in provided.items():
+        if name not in spec_inputs:
+            resolved[name] = values if len(values) != 1 else values[0]
+
+    return resolved
+
+
+def list_pipelines_dumped() -> tuple[dict[str, object], ...]:
+    """Serialised form of every registered pipeline, rebuilt only after a registration."""
+
+    global _PIPELINE_DICTS
+    if _PIPELINE_DICTS is None:
+        _PIPELINE_DICTS = tuple(spec.to_dict() for spec in _PIPELINES.values())
+    return _PIPELINE_DICTS
+
+
 def _to_bool(value: object) -> bool:
     if isinstance(value, bool):
         return value
@@ -153,16 +225,34 @@ def _clean_list(value: object) -> List[str]:
     if value is None:
         return []
     if isinstance(value, (list, tuple)):
-        return [str(item) for item in value if str(item)]
+        return [text for item in value if (text := str(item))]
     return [str(value)]
 
 
+def _iso_z(moment: datetime) -> str:
+    # isoformat() is C-level and beats both strftime and f-string field formatting; for whole-second
+    # UTC datetimes it yields exactly "%Y-%m-%dT%H:%M:%SZ" once the offset is swapped for "Z".
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def _now_iso() -> str:
+    return _iso_z(datetime.now(timezone.utc).replace(microsecond=0))
+
+
+def _collect_logs(logs: List[str], *receipts: Mapping[str, object]) -> None:
+    """Append each receipt's non-empty stdout, then stderr, to *logs*."""
+
+    logs.extend(text for receipt in receipts for key in ("stdout", "stderr") if (text := receipt.get(key)))
+
+
 def _parse_key_value_pairs(values: List[str]) -> Dict[str, str]:
+    if not values:
+        return {}
     pairs: Dict[str, str] = {}
     for entry in values:
-        if "=" not in entry:
+        key, sep, raw_value = entry.partition("=")
+        if not sep:
             raise PipelineError(f"Expected key=value format (got '{entry}')")
-        key, raw_value = entry.split("=", 1)
         key = key.strip()
         if not key:
             raise PipelineError("Key cannot be empty in key=value input.")
@@ -170,6 +260,59 @@ def _parse_key_value_pairs(values: List[str]) -> Dict[str, str]:
     return pairs
 
 
+def _uv_env(workspace_root: Path, base_env: Mapping[str, str]) -> Dict[str, str]:
+    """*base_env* for ``uv`` subprocesses, pointing the uv cache at ``<workspace>/.cache/uv``.
+
+    Keeping the cache in the workspace lets CI persist it between runs (e.g. ``actions/cache`` keyed on
+    ``hashFiles('**/uv.lock')``); a ``UV_CACHE_DIR`` already set in the environment wins.
+    """
+
+    env = dict(base_env)
+    env.setdefault("UV_CACHE_DIR", os.path.join(str(workspace_root), ".cache", "uv"))
+    return env
+
+
+_OUTPUT_TAIL_LINES = 2000
+
+
+def _drain(stream: IO[str], sink: deque[str]) -> None:
+    with stream:
+        for line in stream:
+            sink.append(line)
+
+
+def _run_captured_tail(
+    command: List[str],
+    *,
+    cwd: str | Path,
+    env: Optional[Dict[str, str]] = None,
+) -> tuple[int, str, str]:
+    """Run *command*, keeping only the last ``_OUTPUT_TAIL_LINES`` lines of each stream in memory."""
+
+    proc = subprocess.Popen(
+        command,
+        cwd=str(cwd),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        bufsize=65536,
+    )
+    stdout_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    stderr_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, stdout_tail), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, stderr_tail), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    returncode = proc.wait()
+    for reader in readers:
+        reader.join()
+    return returncode, "".join(stdout_tail), "".join(stderr_tail)
+
+
 def _run_uv_build(
     *,
     workspace_root: Path,
@@ -177,112 +320,320 @@ def _run_uv_build(
     out_dir: str,
     extra_args: List[str],
     env: Optional[Dict[str, str]] = None,
+    reuse: bool = False,
+    base_env: Optional[Mapping[str, str]] = None,
 ) -> tuple[List[str], Dict[str, object]]:
-    project_path = Path(project)
-    if not project_path.is_absolute():
-        project_path = workspace_root / project_path
-    if not project_path.exists():
+    # Plain strings: these only feed argv, scandir and the receipt. join() keeps absolute inputs as-is.
+    root = str(workspace_root)
+    project_path = os.path.join(root, project)
+    if not os.path.exists(project_path):
         raise PipelineError(f"Build project path not found: {project_path}")
 
-    out_path = Path(out_dir)
-    if not out_path.is_absolute():
-        out_path = workspace_root / out_path
-    out_path.mkdir(parents=True, exist_ok=True)
+    out_path = os.path.join(root, out_dir)
+    os.makedirs(out_path, exist_ok=True)
 
     command = [
         "uv",
         "build",
         "--project",
-        str(project_path),
+        project_path,
         "--wheel",
         "--out-dir",
-        str(out_path),
+        out_path,
     ]
     command.extend(str(arg) for arg in extra_args)
 
-    merged_env = os.environ.copy()
+    cache_path = fingerprint = None
+    if reuse:
+        cache_path, fingerprint = _build_cache_key(root, project_path, out_path, command, env)
+        cached = _load_cached_build(cache_path, fingerprint, root)
+        if cached is not None:
+            return cached
+
+    merged_env = _uv_env(workspace_root, os.environ if base_env is None else base_env)
     if env:
         merged_env.update(env)
 
-    result = subprocess.run(
-        command,
-        cwd=str(project_path),
-        capture_output=True,
-        text=True,
-        env=merged_env,
-    )
-    if result.returncode != 0:
-        raise PipelineError(f"uv build failed ({result.returncode}): {result.stderr.strip() or result.stdout.strip()}")
-
-    wheels = sorted(out_path.glob("*.whl"))
-    if not wheels:
+    returncode, stdout, stderr = _run_captured_tail(command, cwd=project_path, env=merged_env)
+    if returncode != 0:
+        raise PipelineError(f"uv build failed ({returncode}): {stderr.strip() or stdout.strip()}")
+
+    # One scandir pass; wheels under the workspace are reported relative to it, others stay absolute.
+    root_prefix = os.path.join(root, "")
+    with os.scandir(out_path) as entries:
+        resolved = sorted(
+            entry.path[len(root_prefix):] if entry.path.startswith(root_prefix) else entry.path
+            for entry in entries
+            if entry.name.endswith(".whl")
+        )
+    if not resolved:
         raise PipelineError(f"No wheels produced in {out_path}")
 
-    resolved: List[str] = []
-    for wheel in wheels:
-        try:
-            resolved.append(str(wheel.relative_to(workspace_root)))
-        except ValueError:
-            resolved.append(str(wheel))
     receipt = {
         "status": "ok",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "project": str(project_path),
-        "out_dir": str(out_path),
+        "timestamp": _now_iso(),
+        "project": project_path,
+        "out_dir": out_path,
         "command": command,
-        "stdout": result.stdout,
-        "stderr": result.stderr,
+        "stdout": stdout,
+        "stderr": stderr,
         "wheels": resolved,
     }
+    if cache_path is not None:
+        _store_cached_build(cache_path, fingerprint, receipt)
     return resolved, receipt
 
 
-def _copy_tree(src: Path, dst: Path) -> None:
-    if dst.exists():
-        shutil.rmtree(dst)
-    shutil.copytree(
-        src,
-        dst,
-        dirs_exist_ok=True,
-        ignore=shutil.ignore_patterns(
-            "__pycache__",
-            ".pytest_cache",
-            ".mypy_cache",
-            ".ruff_cache",
-            ".venv",
-            ".git",
-            ".eggs",
-            "*.egg-info",
-        ),
+# Build outputs that may sit inside a project; they never feed the wheel.
+_BUILD_OUTPUT_NAMES = frozenset({"build", "dist"})
+
+
+def _build_cache_key(
+    root: str, project_path: str, out_path: str, command: List[str], env: Optional[Dict[str, str]]
+) -> tuple[str, str]:
+    """Return ``(cache_file, fingerprint)`` for a uv build of *project_path* into *out_path*.
+
+    The fingerprint covers the command, the env overrides, the workspace ``uv.lock`` and the path,
+    size and mtime of every source file, so a version bump (which rewrites ``pyproject.toml``), a
+    relock or any edit invalidates it. Path dependencies outside the project and the build backend
+    version are not tracked, which is why reuse is opt-in.
+    """
+
+    import hashlib
+
+    rows: List[str] = []
+    pending = [project_path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    name in _COPY_IGNORE_NAMES
+                    or name in _BUILD_OUTPUT_NAMES
+                    or name.endswith(_COPY_IGNORE_SUFFIXES)
+                ):
+                    continue
+                if entry.is_dir():
+                    pending.append(entry.path)
+                else:
+                    info = entry.stat()
+                    rows.append(f"{entry.path}\0{info.st_size}\0{info.st_mtime_ns}")
+    lockfile = os.path.join(root, "uv.lock")
+    if os.path.isfile(lockfile):
+        info = os.stat(lockfile)
+        rows.append(f"{lockfile}\0{info.st_size}\0{info.st_mtime_ns}")
+    rows.sort()
+    rows.extend(command)
+    rows.extend(f"{key}={value}" for key, value in sorted((env or {}).items()))
+
+    fingerprint = hashlib.sha256("\n".join(rows).encode()).hexdigest()
+    # One cache file per project, so repeated builds overwrite rather than accumulate.
+    name = hashlib.sha256(project_path.encode()).hexdigest()[:16]
+    return os.path.join(out_path, ".build-cache", f"{name}.receipt.json"), fingerprint
+
+
+def _load_cached_build(
+    cache_path: str, fingerprint: str, root: str
+) -> Optional[tuple[List[str], Dict[str, object]]]:
+    import json
+
+    try:
+        with open(cache_path, encoding="utf-8") as handle:
+            cached = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+        return None
+    receipt = cached.get("receipt")
+    if not isinstance(receipt, dict):
+        return None
+    wheels = receipt.get("wheels")
+    if not wheels or not all(os.path.isfile(os.path.join(root, wheel)) for wheel in wheels):
+        return None
+    receipt.update(
+        status="cached",
+        built_at=receipt.get("timestamp"),
+        timestamp=_now_iso(),
+        stdout="",
+        stderr="",
+    )
+    return list(wheels), receipt
+
+
+def _store_cached_build(cache_path: str, fingerprint: str, receipt: Dict[str, object]) -> None:
+    import json
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump({"fingerprint": fingerprint, "receipt": receipt}, handle)
+    os.replace(tmp_path, cache_path)
+
+
+_COPY_IGNORE_NAMES = frozenset(
+    {
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".venv",
+        ".git",
+        ".eggs",
+    }
+)
+_COPY_IGNORE_SUFFIXES = (".egg-info",)
+
+
+def _remove_entry(entry: os.DirEntry[str]) -> None:
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)
+
+
+def _is_fresh(src_stat: os.stat_result, dst_stat: os.stat_result) -> bool:
+    # clone_file copies mtimes with copystat, so matching size + mtime_ns means an earlier run wrote it.
+    return (
+        stat.S_ISREG(dst_stat.st_mode)
+        and dst_stat.st_size == src_stat.st_size
+        and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
     )
 
 
+def _collect_copy_jobs(src: str, dst: str, files: List[tuple[str, str]], dirs: List[tuple[str, str]]) -> None:
+    """Mirror *src* under *dst*, queueing only leaf files whose copy in *dst* is missing or out of date.
+
+    Entries already in *dst* that no longer exist (or are ignored) in *src* are removed.
+    """
+
+    os.makedirs(dst, exist_ok=True)
+    dirs.append((src, dst))
+    with os.scandir(dst) as entries:
+        existing = {entry.name: entry for entry in entries}
+    with os.scandir(src) as entries:
+        for entry in entries:
+            name = entry.name
+            if name in _COPY_IGNORE_NAMES or name.endswith(_COPY_IGNORE_SUFFIXES):
+                continue
+            target = os.path.join(dst, name)
+            current = existing.pop(name, None)
+            # Like copytree(symlinks=False): follow links and copy what they point at.
+            if entry.is_dir():
+                if current is not None and not current.is_dir(follow_symlinks=False):
+                    os.unlink(current.path)
+                _collect_copy_jobs(entry.path, target, files, dirs)
+                continue
+            if current is not None:
+                if _is_fresh(entry.stat(), current.stat(follow_symlinks=False)):
+                    continue
+                # Unlink rather than overwrite: the old copy may be read-only or hard-linked elsewhere.
+                _remove_entry(current)
+            files.append((entry.path, target))
+    for stale in existing.values():
+        _remove_entry(stale)
+
+
+def _run_copy_jobs(files: List[tuple[str, str]], dirs: List[tuple[str, str]]) -> None:
+    if len(files) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # File copies are I/O bound and release the GIL, so overlap them.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            for _ in executor.map(lambda job: clone_file(*job), files):
+                pass
+    else:
+        for src, dst in files:
+            clone_file(src, dst)
+    # Directory timestamps last, deepest first, so the file writes above don't clobber them.
+    for src, dst in reversed(dirs):
+        shutil.copystat(src, dst)
+
+
+def _copy_tree(src: Path, dst: Path) -> None:
+    files: List[tuple[str, str]] = []
+    dirs: List[tuple[str, str]] = []
+    _collect_copy_jobs(os.fspath(src), os.fspath(dst), files, dirs)
+    _run_copy_jobs(files, dirs)
+
+
+def _prune_staging(root: str, expected: set[str]) -> None:
+    """Remove entries under *root* that are not one of, or a parent directory of, the *expected* paths."""
+
+    allowed: Dict[str, set[str]] = {}
+    for relative in expected:
+        parent = ""
+        for part in relative.split("/"):
+            allowed.setdefault(parent, set()).add(part)
+            parent = os.path.join(parent, part)
+    for parent, names in allowed.items():
+        if parent in expected:
+            continue
+        directory = os.path.join(root, parent)
+        if not os.path.isdir(directory):
+            continue
+        with os.scandir(directory) as entries:
+            stale = [entry for entry in entries if entry.name not in names]
+        for entry in stale:
+            _remove_entry(entry)
+
+
 def _stage_sdk_sources(workspace_root: Path) -> Path:
     source_root = workspace_root / "apps" / "aware-sdk"
     staging_root = workspace_root / "build" / "sdk-export"
+    scratch_root = workspace_root / "build" / ".sdk-export.tmp"
+
+    # Check every required source up front and report all missing ones before any copying starts.
+    workspace = os.fspath(workspace_root)
+    missing = [
+        os.path.join(workspace, src_rel)
+        for src_rel, _ in SDK_EXPORT_ENTRIES
+        if not os.path.isdir(os.path.join(workspace, src_rel))
+    ]
+    if missing:
+        raise PipelineError(f"SDK export sources missing: {', '.join(missing)}")
 
+    # Re-stage on top of the previous export, in a scratch dir that is swapped into place at the end:
+    # unchanged files are only stat'ed, and an interrupted run never leaves a half-built sdk-export.
     if staging_root.exists():
-        shutil.rmtree(staging_root)
-    staging_root.mkdir(parents=True, exist_ok=True)
-
-    for relative_dir in SDK_EXPORT_BASE_DIRS:
-        src_dir = source_root / relative_dir
-        if src_dir.exists():
-            _copy_tree(src_dir, staging_root / relative_dir)
-
-    for relative_file in SDK_EXPORT_BASE_FILES:
-        src_file = source_root / relative_file
-        if src_file.exists():
-            dst_file = staging_root / relative_file
-            dst_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src_file, dst_file)
+        if scratch_root.exists():
+            shutil.rmtree(scratch_root)
+        os.replace(staging_root, scratch_root)
+    scratch_root.mkdir(parents=True, exist_ok=True)
+    scratch = os.fspath(scratch_root)
+
+    expected: set[str] = set()
+    base_dirs = [relative_dir for relative_dir in SDK_EXPORT_BASE_DIRS if (source_root / relative_dir).exists()]
+    base_files = [relative_file for relative_file in SDK_EXPORT_BASE_FILES if (source_root / relative_file).exists()]
+    expected.update(base_dirs, base_files, (dst_rel for _, dst_rel in SDK_EXPORT_ENTRIES))
+    _prune_staging(scratch, expected)
+
+    # All destinations are disjoint, so queue every tree and file and copy them in one pool.
+    files: List[tuple[str, str]] = []
+    dirs: List[tuple[str, str]] = []
+    for relative_dir in base_dirs:
+        _collect_copy_jobs(os.fspath(source_root / relative_dir), os.path.join(scratch, relative_dir), files, dirs)
+
+    for relative_file in base_files:
+        src_file = os.fspath(source_root / relative_file)
+        dst_file = os.path.join(scratch, relative_file)
+        try:
+            dst_stat = os.stat(dst_file, follow_symlinks=False)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(dst_file), exist_ok=True)
+        else:
+            if _is_fresh(os.stat(src_file), dst_stat):
+                continue
+            if stat.S_ISDIR(dst_stat.st_mode):
+                shutil.rmtree(dst_file)
+            else:
+                os.unlink(dst_file)
+        files.append((src_file, dst_file))
 
     for src_rel, dst_rel in SDK_EXPORT_ENTRIES:
-        src_path = workspace_root / src_rel
-        if not src_path.exists():
-            raise PipelineError(f"SDK export source missing: {src_path}")
-        dst_path = staging_root / dst_rel
-        _copy_tree(src_path, dst_path)
+        _collect_copy_jobs(os.path.join(workspace, src_rel), os.path.join(scratch, dst_rel), files, dirs)
+
+    _run_copy_jobs(files, dirs)
+    os.replace(scratch_root, staging_root)
 
     return staging_root
 
@@ -313,12 +664,12 @@ def _pipeline_cli_bundle(context: PipelineContext) -> PipelineResult:
         channel=str(channel),
         version=str(version),
         platform=str(platform),
-        wheels=[str(path) for path in wheels],
+        wheels=wheels,
         output_dir=str(output_dir),
-        providers_dir=[str(path) for path in providers_dir] or None,
-        provider_wheels=[str(path) for path in provider_wheels] or None,
+        providers_dir=providers_dir or None,
+        provider_wheels=provider_wheels or None,
         dependencies_file=str(dependencies_file) if dependencies_file else None,
-        manifest_overrides=[str(item) for item in overrides] or None,
+        manifest_overrides=overrides or None,
         generate_lockfile=generate_lock,
         lock_output=str(lock_output) if lock_output else None,
         python_version=str(python_version) if python_version else None,
@@ -410,32 +761,66 @@ def _pipeline_terminal_providers(context: PipelineContext) -> PipelineResult:
     )
 
 
+_LOG_TAIL_BYTES = 8192
+
+
+def _read_tail(handle: IO[bytes]) -> str:
+    size = handle.seek(0, os.SEEK_END)
+    handle.seek(max(0, size - _LOG_TAIL_BYTES))
+    return handle.read().decode("utf-8", "replace")
+
+
+def _pytest_command(project: str, *pytest_args: str, concurrent_suites: int = 1) -> List[str]:
+    """``uv run`` *project*'s pytest, serially unless ``AWARE_PYTEST_WORKERS`` opts in to pytest-xdist.
+
+    ``AWARE_PYTEST_WORKERS`` takes a worker count or ``auto``; xdist comes from the project's ``test``
+    extra. With ``auto``, *concurrent_suites* suites running side by side split the CPUs between them.
+    """
+
+    command = ["uv", "run", "--project", project]
+    workers = os.environ.get("AWARE_PYTEST_WORKERS", "").strip()
+    if workers == "auto" and concurrent_suites > 1:
+        share = (os.cpu_count() or 1) // concurrent_suites
+        # A single xdist worker only adds start-up cost over a plain serial run.
+        workers = str(share) if share > 1 else "0"
+    if not workers or workers == "0":
+        return [*command, "pytest", *pytest_args]
+    # One test file per worker at a time keeps module-scoped fixtures on a single worker.
+    return [*command, "--extra", "test", "pytest", *pytest_args, "-n", workers, "--dist=loadfile"]
+
+
 def _run_release_tests(command: List[str], *, cwd: Path, env: Optional[Dict[str, str]] = None) -> Dict[str, object]:
-    proc = subprocess.run(
-        command,
-        cwd=str(cwd),
-        capture_output=True,
-        text=True,
-        env=env,
-    )
-    result = {
-        "command": command,
-        "returncode": proc.returncode,
-        "stdout": proc.stdout,
-        "stderr": proc.stderr,
-    }
+    import tempfile
+
+    # Test runs can be very chatty: let the child write straight to disk and keep only a tail in
+    # memory. The full logs are kept for a failed run and removed once the suite passes.
+    with (
+        tempfile.NamedTemporaryFile(prefix="aware-tests-", suffix=".stdout.log", delete=False) as out_file,
+        tempfile.NamedTemporaryFile(prefix="aware-tests-", suffix=".stderr.log", delete=False) as err_file,
+    ):
+        proc = subprocess.run(command, cwd=str(cwd), env=env, stdout=out_file, stderr=err_file)
+        stdout = _read_tail(out_file)
+        stderr = _read_tail(err_file)
     if proc.returncode != 0:
-        snippet_stdout = proc.stdout[-2000:] if proc.stdout else ""
-        snippet_stderr = proc.stderr[-2000:] if proc.stderr else ""
+        snippet_stdout = stdout[-2000:] if stdout else ""
+        snippet_stderr = stderr[-2000:] if stderr else ""
         message = (
             "Aware test suite failed; see stdout/stderr for details.\n"
             "--- stdout (tail) ---\n"
             f"{snippet_stdout}\n"
             "--- stderr (tail) ---\n"
             f"{snippet_stderr}\n"
+            f"Full logs: {out_file.name}, {err_file.name}\n"
         )
         raise PipelineError(message)
-    return result
+    for log_path in (out_file.name, err_file.name):
+        os.unlink(log_path)
+    return {
+        "command": command,
+        "returncode": proc.returncode,
+        "stdout": stdout,
+        "stderr": stderr,
+    }
 
 
 def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
@@ -448,7 +833,7 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
     skip_versioning = _to_bool(context.get("skip-versioning"))
     dry_run = _to_bool(context.get("dry-run"))
     timestamp = datetime.now(timezone.utc).replace(microsecond=0)
-    timestamp_iso = timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+    timestamp_iso = _iso_z(timestamp)
 
     version_config = VersionConfig.from_project(
         project_root=workspace_root / "tools" / "release",
@@ -462,9 +847,8 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
     if not skip_versioning:
         new_version = bump_version(previous_version, bump_type)
         if not dry_run:
-            write_version(version_config, new_version)
             summary_lines = context.get_list("changelog-entry")
-            changelog_entry = update_changelog(
+            changelog_entry = apply_version_bump(
                 version_config,
                 new_version,
                 timestamp,
@@ -499,12 +883,10 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
             workspace_root=workspace_root,
             project=str(build_project),
             out_dir=str(build_out_dir),
-            extra_args=[str(arg) for arg in build_args],
+            extra_args=build_args,
+            base_env=context.base_env,
         )
-        if build_receipt.get("stdout"):
-            logs.append(str(build_receipt["stdout"]))
-        if build_receipt.get("stderr"):
-            logs.append(str(build_receipt["stderr"]))
+        _collect_logs(logs, build_receipt)
     receipts["build"] = build_receipt
 
     manual_wheels = [wheel for wheel in context.get_list("wheel") if wheel]
@@ -513,12 +895,12 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
         raise PipelineError("No wheels available for bundle step; build or provide --input wheel=...")
     artifacts["wheels"] = final_wheels
 
-    bundle_inputs = dict(context.inputs)
-    bundle_inputs["wheel"] = final_wheels
+    # Overlay the wheel list instead of copying every input for the bundle step.
     bundle_context = PipelineContext(
         workspace_root=workspace_root,
-        inputs=bundle_inputs,
+        inputs=ChainMap({"wheel": final_wheels}, context.inputs),
         raw_inputs=context.raw_inputs,
+        base_env=context.base_env,
     )
 
     bundle_result = _pipeline_cli_bundle(bundle_context)
@@ -540,7 +922,9 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
         workspace_root=workspace_root,
         inputs=rules_inputs,
         raw_inputs={},
+        base_env=context.base_env,
     )
+
     rules_result = _pipeline_rules_version(rules_context)
     if rules_result.status != "ok":
         raise PipelineError("Rule generation step failed; aborting release.")
@@ -551,11 +935,12 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
 
     skip_tests = _to_bool(context.get("skip-tests"))
     tests_receipt: Dict[str, object]
+    tests_ts = _now_iso()
     if skip_tests:
         tests_receipt = {
             "status": "skipped",
             "reason": "skip-tests flag enabled",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": tests_ts,
         }
     else:
         tests_command = context.get_list("tests-command")
@@ -579,14 +964,15 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
             )
             tests_receipt = {
                 "status": "ok",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": tests_ts,
                 **result,
             }
-            logs.append(result.get("stdout", ""))
+            if stdout := result.get("stdout"):
+                logs.append(stdout)
         except PipelineError as exc:
             tests_receipt = {
                 "status": "failed",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": tests_ts,
                 "error": str(exc),
             }
             receipts["tests"] = tests_receipt
@@ -595,11 +981,12 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
 
     skip_workflow = _to_bool(context.get("skip-workflow"))
     workflow_receipt: Dict[str, object]
+    workflow_ts = _now_iso()
     if skip_workflow:
         workflow_receipt = {
             "status": "skipped",
             "reason": "skip-workflow flag enabled",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": workflow_ts,
         }
     else:
         workflow_slug = context.get("workflow-slug") or "cli-release"
@@ -619,6 +1006,10 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
         workflow_dry_run = _to_bool(context.get("workflow-dry-run"))
         token_env = context.get("workflow-token-env")
 
+        from aware_release.workflows import WorkflowTriggerError, trigger_workflow
+
+        from .workflows import get_workflow
+
         spec = get_workflow(workflow_slug)
         try:
             dispatch_result = trigger_workflow(
@@ -631,7 +1022,7 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
         except WorkflowTriggerError as exc:
             workflow_receipt = {
                 "status": "failed",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": workflow_ts,
                 "error": str(exc),
             }
             receipts["workflow"] = workflow_receipt
@@ -639,7 +1030,7 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
 
         workflow_receipt = {
             "status": "skipped" if dispatch_result.dry_run else "ok",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": workflow_ts,
             "payload": dispatch_result.model_dump(mode="json"),
         }
         if dispatch_result.response_headers:
@@ -647,11 +1038,12 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
     receipts["workflow"] = workflow_receipt
 
     skip_publish = _to_bool(context.get("skip-publish"))
+    publish_ts = _now_iso()
     if skip_publish:
         publish_receipt = {
             "status": "skipped",
             "reason": "skip-publish flag enabled",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": publish_ts,
         }
     else:
         dry_run_publish = _to_bool(context.get("dry-run"))
@@ -666,14 +1058,14 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
         except Exception as exc:
             publish_receipt = {
                 "status": "failed",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": publish_ts,
                 "error": str(exc),
             }
             receipts["publish"] = publish_receipt
             raise PipelineError(f"Publish step failed: {exc}") from exc
         publish_receipt = {
             "status": "skipped" if dry_run_publish else "ok",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": publish_ts,
             "payload": publish_payload,
         }
     receipts["publish"] = publish_receipt
@@ -695,18 +1087,39 @@ def _pipeline_cli_release_e2e(context: PipelineContext) -> PipelineResult:
     )
 
 
-def _pipeline_tests_release(context: PipelineContext) -> PipelineResult:
+_BuildAndTest = Callable[..., tuple[List[str], Dict[str, object], Dict[str, object]]]
+
+
+@dataclass(frozen=True, slots=True)
+class _ReleaseSpec:
+    """What differs between the single-package release pipelines; the flow lives in ``_run_release``."""
+
+    project: str
+    module_relpath: str
+    workflow_slug: str
+    build_and_test: _BuildAndTest
+    version_artifact: bool = False
+
+
+def _skipped_tests_receipt(timestamp_iso: str) -> Dict[str, object]:
+    return {
+        "status": "skipped",
+        "reason": "skip-tests flag enabled",
+        "timestamp": timestamp_iso,
+    }
+
+
+def _run_release(spec: _ReleaseSpec, context: PipelineContext) -> PipelineResult:
     workspace_root = context.workspace_root
     bump_type = str(context.get("bump") or "patch")
     skip_versioning = _to_bool(context.get("skip-versioning"))
     dry_run = _to_bool(context.get("dry-run"))
     timestamp = datetime.now(timezone.utc).replace(microsecond=0)
-    timestamp_iso = timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+    timestamp_iso = _iso_z(timestamp)
 
-    project_dir = workspace_root / "tools" / "test-runner"
     version_config = VersionConfig.from_project(
-        project_root=project_dir,
-        module_relpath="aware_test_runner/__init__.py",
+        project_root=workspace_root / spec.project,
+        module_relpath=spec.module_relpath,
         changelog="CHANGELOG.md",
     )
 
@@ -717,9 +1130,8 @@ def _pipeline_tests_release(context: PipelineContext) -> PipelineResult:
     if not skip_versioning:
         new_version = bump_version(previous_version, bump_type)
         if not dry_run:
-            write_version(version_config, new_version)
             summary_lines = context.get_list("changelog-entry")
-            changelog_entry = update_changelog(
+            changelog_entry = apply_version_bump(
                 version_config,
                 new_version,
                 timestamp,
@@ -730,46 +1142,11 @@ def _pipeline_tests_release(context: PipelineContext) -> PipelineResult:
     receipts: Dict[str, object] = {}
     artifacts: Dict[str, object] = {}
 
-    built_wheels, build_receipt = _run_uv_build(
-        workspace_root=workspace_root,
-        project="tools/test-runner",
-        out_dir="build/public/aware-test-runner/dist",
-        extra_args=[],
-    )
+    built_wheels, build_receipt, tests_receipt = spec.build_and_test(context, timestamp_iso=timestamp_iso)
     artifacts["wheels"] = built_wheels
     receipts["build"] = build_receipt
-    if build_receipt.get("stdout"):
-        logs.append(build_receipt["stdout"])
-    if build_receipt.get("stderr"):
-        logs.append(build_receipt["stderr"])
-
-    skip_tests = _to_bool(context.get("skip-tests"))
-    if skip_tests:
-        tests_receipt = {
-            "status": "skipped",
-            "reason": "skip-tests flag enabled",
-            "timestamp": timestamp_iso,
-        }
-    else:
-        env = os.environ.copy()
-        env.setdefault(
-            "AWARE_TEST_RUNNER_MANIFEST_DIRS",
-            str(workspace_root / "configs" / "manifests"),
-        )
-        tests_command = [
-            "uv",
-            "run",
-            "aware-tests",
-            "--manifest",
-            "oss",
-            "--stable",
-            "--no-warnings",
-        ]
-        tests_receipt = _run_release_tests(command=tests_command, cwd=workspace_root, env=env)
-        logs.append(tests_receipt.get("stdout", ""))
-        if tests_receipt.get("stderr"):
-            logs.append(tests_receipt["stderr"])
     receipts["tests"] = tests_receipt
+    _collect_logs(logs, build_receipt, tests_receipt)
 
     skip_workflow = _to_bool(context.get("skip-workflow"))
     workflow_dry_run = _to_bool(context.get("workflow-dry-run"))
@@ -781,7 +1158,11 @@ def _pipeline_tests_release(context: PipelineContext) -> PipelineResult:
             "timestamp": timestamp_iso,
         }
     else:
-        spec = get_workflow("tests-release")
+        from aware_release.workflows import WorkflowTriggerError, trigger_workflow
+
+        from .workflows import get_workflow
+
+        workflow_spec = get_workflow(spec.workflow_slug)
         workflow_inputs = {
             "version": new_version,
             "dry_run": "true" if workflow_dry_run else "false",
@@ -789,7 +1170,7 @@ def _pipeline_tests_release(context: PipelineContext) -> PipelineResult:
         }
         try:
             dispatch_result = trigger_workflow(
-                spec,
+                workflow_spec,
                 inputs=workflow_inputs,
                 dry_run=workflow_dry_run,
             )
@@ -818,13 +1199,14 @@ def _pipeline_tests_release(context: PipelineContext) -> PipelineResult:
         "skip_versioning": skip_versioning,
         "dry_run": dry_run,
     }
-    artifacts["version"] = new_version
+    if spec.version_artifact:
+        artifacts["version"] = new_version
 
     return PipelineResult(
         status="ok",
         artifacts=artifacts,
         receipts=receipts,
-        logs=[log for log in logs if log],
+        logs=logs,
         data={
             "version": receipts["version"],
             "build": build_receipt,
@@ -834,544 +1216,341 @@ def _pipeline_tests_release(context: PipelineContext) -> PipelineResult:
     )
 
 
-def _pipeline_file_system_release(context: PipelineContext) -> PipelineResult:
+def _build_and_test_test_runner(
+    context: PipelineContext, *, timestamp_iso: str
+) -> tuple[List[str], Dict[str, object], Dict[str, object]]:
     workspace_root = context.workspace_root
-    bump_type = str(context.get("bump") or "patch")
-    skip_versioning = _to_bool(context.get("skip-versioning"))
-    dry_run = _to_bool(context.get("dry-run"))
-    timestamp = datetime.now(timezone.utc).replace(microsecond=0)
-    timestamp_iso = timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+    built_wheels, build_receipt = _run_uv_build(
+        workspace_root=workspace_root,
+        project="tools/test-runner",
+        out_dir="build/public/aware-test-runner/dist",
+        extra_args=[],
+        reuse=_to_bool(context.get("reuse-build")),
+        base_env=context.base_env,
+    )
+    if _to_bool(context.get("skip-tests")):
+        return built_wheels, build_receipt, _skipped_tests_receipt(timestamp_iso)
 
-    project_dir = workspace_root / "libs" / "file_system"
-    version_config = VersionConfig.from_project(
-        project_root=project_dir,
-        module_relpath="aware_file_system/__init__.py",
-        changelog="CHANGELOG.md",
+    env = _uv_env(workspace_root, context.base_env)
+    env.setdefault(
+        "AWARE_TEST_RUNNER_MANIFEST_DIRS",
+        str(workspace_root / "configs" / "manifests"),
     )
+    tests_command = [
+        "uv",
+        "run",
+        "aware-tests",
+        "--manifest",
+        "oss",
+        "--stable",
+        "--no-warnings",
+    ]
+    tests_receipt = _run_release_tests(command=tests_command, cwd=workspace_root, env=env)
+    return built_wheels, build_receipt, tests_receipt
 
-    previous_version = read_version(version_config)
-    new_version = previous_version
-    changelog_entry = None
 
-    if not skip_versioning:
-        new_version = bump_version(previous_version, bump_type)
-        if not dry_run:
-            write_version(version_config, new_version)
-            summary_lines = context.get_list("changelog-entry")
-            changelog_entry = update_changelog(
-                version_config,
-                new_version,
-                timestamp,
-                [line for line in summary_lines if line],
-            )
-
-    logs: List[str] = []
-    receipts: Dict[str, object] = {}
-    artifacts: Dict[str, object] = {}
+def _build_and_test_project(
+    context: PipelineContext,
+    *,
+    project: str,
+    out_dir: str,
+    timestamp_iso: str,
+) -> tuple[List[str], Dict[str, object], Dict[str, object]]:
+    """Build *project*'s wheel and run its test suite, returning ``(wheels, build_receipt, tests_receipt)``.
 
-    built_wheels, build_receipt = _run_uv_build(
-        workspace_root=workspace_root,
-        project="libs/file_system",
-        out_dir="build/public/aware-file-system/dist",
-        extra_args=[],
-    )
-    artifacts["wheels"] = built_wheels
-    receipts["build"] = build_receipt
-    if build_receipt.get("stdout"):
-        logs.append(build_receipt["stdout"])
-    if build_receipt.get("stderr"):
-        logs.append(build_receipt["stderr"])
+    The tests run from source rather than from the built wheel, so by default the two uv
+    subprocesses overlap; the ``serial-release`` input restores build-then-test.
+    """
 
-    skip_tests = _to_bool(context.get("skip-tests"))
-    if skip_tests:
-        tests_receipt = {
-            "status": "skipped",
-            "reason": "skip-tests flag enabled",
-            "timestamp": timestamp_iso,
-        }
-    else:
-        tests_command = [
-            "uv",
-            "run",
-            "--project",
-            "libs/file_system",
-            "pytest",
-            "libs/file_system/tests",
-        ]
-        env = os.environ.copy()
-        env.setdefault("UV_NO_WORKSPACE", "1")
-        tests_receipt = _run_release_tests(command=tests_command, cwd=workspace_root, env=env)
-        logs.append(tests_receipt.get("stdout", ""))
-        if tests_receipt.get("stderr"):
-            logs.append(tests_receipt["stderr"])
-    receipts["tests"] = tests_receipt
+    workspace_root = context.workspace_root
+    reuse = _to_bool(context.get("reuse-build"))
 
-    skip_workflow = _to_bool(context.get("skip-workflow"))
-    workflow_dry_run = _to_bool(context.get("workflow-dry-run"))
-    workflow_receipt: Dict[str, object]
-    if skip_workflow:
-        workflow_receipt = {
-            "status": "skipped",
-            "reason": "skip-workflow flag enabled",
-            "timestamp": timestamp_iso,
-        }
-    else:
-        spec = get_workflow("file-system-release")
-        workflow_inputs = {
-            "version": new_version,
-            "dry_run": "true" if workflow_dry_run else "false",
-            "timestamp": timestamp_iso,
-        }
-        try:
-            dispatch_result = trigger_workflow(
-                spec,
-                inputs=workflow_inputs,
-                dry_run=workflow_dry_run,
-            )
-        except WorkflowTriggerError as exc:
-            workflow_receipt = {
-                "status": "failed",
-                "timestamp": timestamp_iso,
-                "error": str(exc),
-            }
-            receipts["workflow"] = workflow_receipt
-            raise PipelineError(str(exc)) from exc
-        workflow_receipt = {
-            "status": "skipped" if dispatch_result.dry_run else "ok",
-            "timestamp": timestamp_iso,
-            "payload": dispatch_result.model_dump(mode="json"),
-        }
-    receipts["workflow"] = workflow_receipt
+    def build() -> tuple[List[str], Dict[str, object]]:
+        return _run_uv_build(
+            workspace_root=workspace_root,
+            project=project,
+            out_dir=out_dir,
+            extra_args=[],
+            reuse=reuse,
+            base_env=context.base_env,
+        )
 
-    receipts["version"] = {
-        "previous": previous_version,
-        "new": new_version,
-        "bump": bump_type,
-        "timestamp": timestamp_iso,
-        "changelog": str(project_dir / "CHANGELOG.md"),
-        "changelog_entry": changelog_entry,
-        "skip_versioning": skip_versioning,
-        "dry_run": dry_run,
-    }
+    if _to_bool(context.get("skip-tests")):
+        built_wheels, build_receipt = build()
+        return built_wheels, build_receipt, _skipped_tests_receipt(timestamp_iso)
 
-    return PipelineResult(
-        status="ok",
-        artifacts=artifacts,
-        receipts=receipts,
-        logs=[log for log in logs if log],
-        data={
-            "version": receipts["version"],
-            "build": build_receipt,
-            "tests": tests_receipt,
-            "workflow": workflow_receipt,
-        },
-    )
+    env = _uv_env(workspace_root, context.base_env)
+    env.setdefault("UV_NO_WORKSPACE", "1")
 
+    def run_tests() -> Dict[str, object]:
+        return _run_release_tests(
+            command=_pytest_command(project, f"{project}/tests"), cwd=workspace_root, env=env
+        )
 
-def _pipeline_environment_release(context: PipelineContext) -> PipelineResult:
-    workspace_root = context.workspace_root
-    bump_type = str(context.get("bump") or "patch")
-    skip_versioning = _to_bool(context.get("skip-versioning"))
-    dry_run = _to_bool(context.get("dry-run"))
-    timestamp = datetime.now(timezone.utc).replace(microsecond=0)
-    timestamp_iso = timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if _to_bool(context.get("serial-release")):
+        built_wheels, build_receipt = build()
+        return built_wheels, build_receipt, run_tests()
 
-    project_dir = workspace_root / "libs" / "environment"
-    version_config = VersionConfig.from_project(
-        project_root=project_dir,
-        module_relpath="aware_environment/__init__.py",
-        changelog="CHANGELOG.md",
-    )
+    from concurrent.futures import ThreadPoolExecutor
 
-    previous_version = read_version(version_config)
-    new_version = previous_version
-    changelog_entry = None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        build_future = executor.submit(build)
+        try:
+            tests_receipt = run_tests()
+        except BaseException:
+            build_future.result()  # a build failure still wins, as it did when tests waited for it
+            raise
+        built_wheels, build_receipt = build_future.result()
+    return built_wheels, build_receipt, tests_receipt
 
-    if not skip_versioning:
-        new_version = bump_version(previous_version, bump_type)
-        if not dry_run:
-            write_version(version_config, new_version)
-            summary_lines = context.get_list("changelog-entry")
-            changelog_entry = update_changelog(
-                version_config,
-                new_version,
-                timestamp,
-                [line for line in summary_lines if line],
-            )
 
-    logs: List[str] = []
-    receipts: Dict[str, object] = {}
-    artifacts: Dict[str, object] = {}
+# Stand-in for the provider version updater used by the staged SDK test run; it only
+# refreshes ``updated_at`` stamps so tests never reach out to real providers.
+_PROVIDER_STUB_SCRIPT = b"""\
+#!/usr/bin/env python3
+from __future__ import annotations
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+import sys
+
+try:  # Optional accelerator; stdlib json writes the same documents.
+    import orjson
+
+    def _loads(raw: bytes) -> object:
+        return orjson.loads(raw)
+
+    def _dumps(data: object) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    import json
+
+    def _loads(raw: bytes) -> object:
+        return json.loads(raw)
+
+    def _dumps(data: object) -> bytes:
+        return (json.dumps(data, indent=2) + '\\n').encode('utf-8')
+
+def _provider_root() -> Path:
+    env_override = os.environ.get('AWARE_TERMINAL_MANIFEST_ROOT')
+    if env_override:
+        return Path(env_override).expanduser().resolve()
+    if len(sys.argv) > 1:
+        return Path(sys.argv[1]).expanduser().resolve()
+    return Path(__file__).resolve().parents[2] / 'libs' / 'providers' / 'terminal' / 'aware_terminal_providers' / 'providers'
+
+def main() -> int:
+    root = _provider_root()
+    if not root.exists():
+        return 0
+    timestamp = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace('+00:00', 'Z')
+    for manifest_path in root.glob('*/releases.json'):
+        try:
+            data = _loads(manifest_path.read_bytes())
+        except Exception:
+            data = {'provider': manifest_path.parent.name, 'channels': {}}
+        channels = data.setdefault('channels', {})
+        if not isinstance(channels, dict):
+            channels = {}
+            data['channels'] = channels
+        if not channels:
+            channels['latest'] = {}
+        for channel in channels.values():
+            if isinstance(channel, dict):
+                channel['updated_at'] = timestamp
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_bytes(_dumps(data))
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
+"""
+
+
+# Environment for the staged SDK test run: defaults the caller's environment may override, then
+# values that are always forced; the per-run staging paths are layered on top.
+_SDK_TEST_ENV_DEFAULTS = MappingProxyType({"UV_NO_WORKSPACE": "1"})
+_SDK_TEST_ENV = MappingProxyType({"AWARE_TERMINAL_ALLOW_MANIFEST_REFRESH": "1"})
+
+
+def _build_and_test_sdk(
+    context: PipelineContext, *, timestamp_iso: str
+) -> tuple[List[str], Dict[str, object], Dict[str, object]]:
+    workspace_root = context.workspace_root
+    staging_root = _stage_sdk_sources(workspace_root)
 
+    build_env = {"UV_NO_WORKSPACE": "1"}
     built_wheels, build_receipt = _run_uv_build(
         workspace_root=workspace_root,
-        project="libs/environment",
-        out_dir="build/public/aware-environment/dist",
+        project=str(staging_root),
+        out_dir="build/public/aware-sdk/dist",
         extra_args=[],
+        env=build_env,
+        reuse=_to_bool(context.get("reuse-build")),
+        base_env=context.base_env,
     )
-    artifacts["wheels"] = built_wheels
-    receipts["build"] = build_receipt
-    if build_receipt.get("stdout"):
-        logs.append(build_receipt["stdout"])
-    if build_receipt.get("stderr"):
-        logs.append(build_receipt["stderr"])
+    if _to_bool(context.get("skip-tests")):
+        return built_wheels, build_receipt, _skipped_tests_receipt(timestamp_iso)
 
-    skip_tests = _to_bool(context.get("skip-tests"))
-    if skip_tests:
-        tests_receipt = {
-            "status": "skipped",
-            "reason": "skip-tests flag enabled",
-            "timestamp": timestamp_iso,
-        }
-    else:
-        tests_command = [
-            "uv",
-            "run",
-            "--project",
-            "libs/environment",
-            "pytest",
-            "libs/environment/tests",
-        ]
-        env = os.environ.copy()
-        env.setdefault("UV_NO_WORKSPACE", "1")
-        tests_receipt = _run_release_tests(command=tests_command, cwd=workspace_root, env=env)
-        logs.append(tests_receipt.get("stdout", ""))
-        if tests_receipt.get("stderr"):
-            logs.append(tests_receipt["stderr"])
-    receipts["tests"] = tests_receipt
-
-    skip_workflow = _to_bool(context.get("skip-workflow"))
-    workflow_dry_run = _to_bool(context.get("workflow-dry-run"))
-    workflow_receipt: Dict[str, object]
-    if skip_workflow:
-        workflow_receipt = {
-            "status": "skipped",
-            "reason": "skip-workflow flag enabled",
-            "timestamp": timestamp_iso,
-        }
-    else:
-        spec = get_workflow("environment-release")
-        workflow_inputs = {
-            "version": new_version,
-            "dry_run": "true" if workflow_dry_run else "false",
-            "timestamp": timestamp_iso,
-        }
-        try:
-            dispatch_result = trigger_workflow(
-                spec,
-                inputs=workflow_inputs,
-                dry_run=workflow_dry_run,
-            )
-        except WorkflowTriggerError as exc:
-            workflow_receipt = {
-                "status": "failed",
-                "timestamp": timestamp_iso,
-                "error": str(exc),
-            }
-            receipts["workflow"] = workflow_receipt
-            raise PipelineError(str(exc)) from exc
-        workflow_receipt = {
-            "status": "skipped" if dispatch_result.dry_run else "ok",
-            "timestamp": timestamp_iso,
-            "payload": dispatch_result.model_dump(mode="json"),
-        }
-    receipts["workflow"] = workflow_receipt
+    stub_script = staging_root / "tools" / "terminal" / "_ci_update_provider_versions.py"
+    if not stub_script.is_file() or stub_script.read_bytes() != _PROVIDER_STUB_SCRIPT:
+        stub_script.write_bytes(_PROVIDER_STUB_SCRIPT)
+        stub_script.chmod(0o755)
 
-    receipts["version"] = {
-        "previous": previous_version,
-        "new": new_version,
-        "bump": bump_type,
-        "timestamp": timestamp_iso,
-        "changelog": str(project_dir / "CHANGELOG.md"),
-        "changelog_entry": changelog_entry,
-        "skip_versioning": skip_versioning,
-        "dry_run": dry_run,
+    providers_root = staging_root / "libs" / "providers" / "terminal" / "aware_terminal_providers" / "providers"
+    env = {
+        **_SDK_TEST_ENV_DEFAULTS,
+        **_uv_env(workspace_root, context.base_env),
+        **_SDK_TEST_ENV,
+        "AWARE_ROOT": str(staging_root),
+        "AWARE_TERMINAL_DEV_ROOT": str(staging_root),
+        "AWARE_TERMINAL_MANIFEST_ROOT": str(providers_root),
+        "AWARE_TERMINAL_MANIFEST_UPDATE_SCRIPT": str(stub_script),
     }
-
-    return PipelineResult(
-        status="ok",
-        artifacts=artifacts,
-        receipts=receipts,
-        logs=[log for log in logs if log],
-        data={
-            "version": receipts["version"],
-            "build": build_receipt,
-            "tests": tests_receipt,
-            "workflow": workflow_receipt,
-        },
+    manifest_dirs = str(staging_root / "aware_sdk" / "configs" / "manifests")
+    existing_manifest_dirs = env.get("AWARE_TEST_RUNNER_MANIFEST_DIRS")
+    env["AWARE_TEST_RUNNER_MANIFEST_DIRS"] = (
+        manifest_dirs if not existing_manifest_dirs else os.pathsep.join([manifest_dirs, existing_manifest_dirs])
     )
+    existing_pytest_opts = env.get("PYTEST_ADDOPTS")
+    filter_expr = "-k 'not publish_pypi'"
+    env["PYTEST_ADDOPTS"] = filter_expr if not existing_pytest_opts else f"{existing_pytest_opts} {filter_expr}"
+    tests_command = [
+        "uv",
+        "run",
+        "--project",
+        str(staging_root / "tools" / "test-runner"),
+        "--with",
+        str(staging_root / "tools" / "release"),
+        "--with",
+        str(staging_root / "tools" / "release-pipeline"),
+        "--with",
+        f"{staging_root / 'libs' / 'file_system'}[test]",
+        "--with",
+        str(staging_root / "libs" / "environment"),
+        "--with",
+        f"{staging_root / 'tools' / 'terminal'}[test]",
+        "--with",
+        f"{staging_root / 'libs' / 'providers' / 'terminal'}[test]",
+        "aware-tests",
+        "--manifest",
+        "oss",
+        "--stable",
+        "--no-warnings",
+    ]
+    tests_receipt = _run_release_tests(command=tests_command, cwd=staging_root, env=env)
+    return built_wheels, build_receipt, tests_receipt
+
+
+_TESTS_RELEASE = _ReleaseSpec(
+    project="tools/test-runner",
+    module_relpath="aware_test_runner/__init__.py",
+    workflow_slug="tests-release",
+    build_and_test=_build_and_test_test_runner,
+    version_artifact=True,
+)
+_FILE_SYSTEM_RELEASE = _ReleaseSpec(
+    project="libs/file_system",
+    module_relpath="aware_file_system/__init__.py",
+    workflow_slug="file-system-release",
+    build_and_test=partial(
+        _build_and_test_project, project="libs/file_system", out_dir="build/public/aware-file-system/dist"
+    ),
+)
+_ENVIRONMENT_RELEASE = _ReleaseSpec(
+    project="libs/environment",
+    module_relpath="aware_environment/__init__.py",
+    workflow_slug="environment-release",
+    build_and_test=partial(
+        _build_and_test_project, project="libs/environment", out_dir="build/public/aware-environment/dist"
+    ),
+)
+_SDK_RELEASE = _ReleaseSpec(
+    project="apps/aware-sdk",
+    module_relpath="aware_sdk/__init__.py",
+    workflow_slug="sdk-release",
+    build_and_test=_build_and_test_sdk,
+)
+
+
+def _pipeline_tests_release(context: PipelineContext) -> PipelineResult:
+    return _run_release(_TESTS_RELEASE, context)
+
+
+def _pipeline_file_system_release(context: PipelineContext) -> PipelineResult:
+    return _run_release(_FILE_SYSTEM_RELEASE, context)
+
+
+def _pipeline_environment_release(context: PipelineContext) -> PipelineResult:
+    return _run_release(_ENVIRONMENT_RELEASE, context)
 
 
 def _pipeline_sdk_release(context: PipelineContext) -> PipelineResult:
-    workspace_root = context.workspace_root
-    bump_type = str(context.get("bump") or "patch")
-    skip_versioning = _to_bool(context.get("skip-versioning"))
-    dry_run = _to_bool(context.get("dry-run"))
-    timestamp = datetime.now(timezone.utc).replace(microsecond=0)
-    timestamp_iso = timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _run_release(_SDK_RELEASE, context)
 
-    project_dir = workspace_root / "apps" / "aware-sdk"
-    version_config = VersionConfig.from_project(
-        project_root=project_dir,
-        module_relpath="aware_sdk/__init__.py",
-        changelog="CHANGELOG.md",
-    )
 
-    previous_version = read_version(version_config)
-    new_version = previous_version
-    changelog_entry = None
+@dataclass(frozen=True, slots=True)
+class _TerminalPackage:
+    name: str
+    project: str  # workspace-relative
+    out_dir: str  # workspace-relative
 
-    if not skip_versioning:
-        new_version = bump_version(previous_version, bump_type)
-        if not dry_run:
-            write_version(version_config, new_version)
-            summary_lines = context.get_list("changelog-entry")
-            changelog_entry = update_changelog(
-                version_config,
-                new_version,
-                timestamp,
-                [line for line in summary_lines if line],
-            )
 
-    staging_root = _stage_sdk_sources(workspace_root)
+_TERMINAL_PACKAGES = (
+    _TerminalPackage("aware-terminal", "tools/terminal", "build/public/aware-terminal/dist"),
+    _TerminalPackage(
+        "aware-terminal-providers", "libs/providers/terminal", "build/public/aware-terminal-providers/dist"
+    ),
+)
+_TERMINAL_CONTROL_CENTER = _TerminalPackage(
+    "aware-terminal-control-center",
+    "tools/terminal-control-center",
+    "build/public/aware-terminal-control-center/dist",
+)
 
-    logs: List[str] = []
-    receipts: Dict[str, object] = {}
-    artifacts: Dict[str, object] = {}
 
-    build_env = {"UV_NO_WORKSPACE": "1"}
+def _build_and_test_package(
+    pkg: _TerminalPackage,
+    context: PipelineContext,
+    skip_tests: bool,
+    timestamp_iso: str,
+    concurrent_suites: int = 1,
+) -> tuple[List[str], Dict[str, object], List[str]]:
+    workspace_root = context.workspace_root
     built_wheels, build_receipt = _run_uv_build(
         workspace_root=workspace_root,
-        project=str(staging_root),
-        out_dir="build/public/aware-sdk/dist",
+        project=pkg.project,
+        out_dir=pkg.out_dir,
         extra_args=[],
-        env=build_env,
+        base_env=context.base_env,
     )
-    artifacts["wheels"] = built_wheels
-    receipts["build"] = build_receipt
-    if build_receipt.get("stdout"):
-        logs.append(build_receipt["stdout"])
-    if build_receipt.get("stderr"):
-        logs.append(build_receipt["stderr"])
+    package_receipts: Dict[str, object] = {"build": build_receipt}
+    logs: List[str] = []
+    _collect_logs(logs, build_receipt)
 
-    skip_tests = _to_bool(context.get("skip-tests"))
     if skip_tests:
-        tests_receipt = {
+        package_receipts["tests"] = {
             "status": "skipped",
             "reason": "skip-tests flag enabled",
             "timestamp": timestamp_iso,
         }
-    else:
-        env = os.environ.copy()
-        env.setdefault("UV_NO_WORKSPACE", "1")
-        env["AWARE_ROOT"] = str(staging_root)
-        manifest_dirs = str(staging_root / "aware_sdk" / "configs" / "manifests")
-        existing_manifest_dirs = env.get("AWARE_TEST_RUNNER_MANIFEST_DIRS")
-        env["AWARE_TEST_RUNNER_MANIFEST_DIRS"] = (
-            manifest_dirs if not existing_manifest_dirs else os.pathsep.join([manifest_dirs, existing_manifest_dirs])
-        )
-        env["AWARE_TERMINAL_DEV_ROOT"] = str(staging_root)
-        env["AWARE_TERMINAL_MANIFEST_ROOT"] = str(
-            staging_root / "libs" / "providers" / "terminal" / "aware_terminal_providers" / "providers"
-        )
-        stub_script = staging_root / "tools" / "terminal" / "_ci_update_provider_versions.py"
-        stub_script.write_text(
-            "\n".join(
-                [
-                    "#!/usr/bin/env python3",
-                    "from __future__ import annotations",
-                    "import json",
-                    "import os",
-                    "from datetime import datetime, timezone",
-                    "from pathlib import Path",
-                    "import sys",
-                    "",
-                    "def _provider_root() -> Path:",
-                    "    env_override = os.environ.get('AWARE_TERMINAL_MANIFEST_ROOT')",
-                    "    if env_override:",
-                    "        return Path(env_override).expanduser().resolve()",
-                    "    if len(sys.argv) > 1:",
-                    "        return Path(sys.argv[1]).expanduser().resolve()",
-                    "    return Path(__file__).resolve().parents[2] / 'libs' / 'providers' / 'terminal' / 'aware_terminal_providers' / 'providers'",
-                    "",
-                    "def main() -> int:",
-                    "    root = _provider_root()",
-                    "    if not root.exists():",
-                    "        return 0",
-                    "    timestamp = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace('+00:00', 'Z')",
-                    "    for manifest_path in root.glob('*/releases.json'):",
-                    "        try:",
-                    "            data = json.loads(manifest_path.read_text(encoding='utf-8'))",
-                    "        except Exception:",
-                    "            data = {'provider': manifest_path.parent.name, 'channels': {}}",
-                    "        channels = data.setdefault('channels', {})",
-                    "        if not isinstance(channels, dict):",
-                    "            channels = {}",
-                    "            data['channels'] = channels",
-                    "        if not channels:",
-                    "            channels['latest'] = {}",
-                    "        for channel in channels.values():",
-                    "            if isinstance(channel, dict):",
-                    "                channel['updated_at'] = timestamp",
-                    "        manifest_path.parent.mkdir(parents=True, exist_ok=True)",
-                    "        manifest_path.write_text(json.dumps(data, indent=2) + '\\n', encoding='utf-8')",
-                    "    return 0",
-                    "",
-                    "if __name__ == '__main__':",
-                    "    raise SystemExit(main())",
-                ]
-            )
-            + "\n",
-            encoding="utf-8",
-        )
-        stub_script.chmod(0o755)
-        env["AWARE_TERMINAL_MANIFEST_UPDATE_SCRIPT"] = str(
-            staging_root / "tools" / "terminal" / "_ci_update_provider_versions.py"
-        )
-        env["AWARE_TERMINAL_ALLOW_MANIFEST_REFRESH"] = "1"
-        existing_pytest_opts = env.get("PYTEST_ADDOPTS")
-        filter_expr = "-k 'not publish_pypi'"
-        env["PYTEST_ADDOPTS"] = filter_expr if not existing_pytest_opts else f"{existing_pytest_opts} {filter_expr}"
-        tests_command = [
-            "uv",
-            "run",
-            "--project",
-            str(staging_root / "tools" / "test-runner"),
-            "--with",
-            str(staging_root / "tools" / "release"),
-            "--with",
-            str(staging_root / "tools" / "release-pipeline"),
-            "--with",
-            f"{staging_root / 'libs' / 'file_system'}[test]",
-            "--with",
-            str(staging_root / "libs" / "environment"),
-            "--with",
-            f"{staging_root / 'tools' / 'terminal'}[test]",
-            "--with",
-            f"{staging_root / 'libs' / 'providers' / 'terminal'}[test]",
-            "aware-tests",
-            "--manifest",
-            "oss",
-            "--stable",
-            "--no-warnings",
-        ]
-        tests_receipt = _run_release_tests(command=tests_command, cwd=staging_root, env=env)
-        logs.append(tests_receipt.get("stdout", ""))
-        if tests_receipt.get("stderr"):
-            logs.append(tests_receipt["stderr"])
-    receipts["tests"] = tests_receipt
-
-    skip_workflow = _to_bool(context.get("skip-workflow"))
-    workflow_dry_run = _to_bool(context.get("workflow-dry-run"))
-    workflow_receipt: Dict[str, object]
-    if skip_workflow:
-        workflow_receipt = {
-            "status": "skipped",
-            "reason": "skip-workflow flag enabled",
-            "timestamp": timestamp_iso,
-        }
-    else:
-        spec = get_workflow("sdk-release")
-        workflow_inputs = {
-            "version": new_version,
-            "dry_run": "true" if workflow_dry_run else "false",
-            "timestamp": timestamp_iso,
-        }
-        try:
-            dispatch_result = trigger_workflow(
-                spec,
-                inputs=workflow_inputs,
-                dry_run=workflow_dry_run,
-            )
-        except WorkflowTriggerError as exc:
-            workflow_receipt = {
-                "status": "failed",
-                "timestamp": timestamp_iso,
-                "error": str(exc),
-            }
-            receipts["workflow"] = workflow_receipt
-            raise PipelineError(str(exc)) from exc
-        workflow_receipt = {
-            "status": "skipped" if dispatch_result.dry_run else "ok",
-            "timestamp": timestamp_iso,
-            "payload": dispatch_result.model_dump(mode="json"),
-        }
-    receipts["workflow"] = workflow_receipt
+        return built_wheels, package_receipts, logs
 
-    receipts["version"] = {
-        "previous": previous_version,
-        "new": new_version,
-        "bump": bump_type,
-        "timestamp": timestamp_iso,
-        "changelog": str(project_dir / "CHANGELOG.md"),
-        "changelog_entry": changelog_entry,
-        "skip_versioning": skip_versioning,
-        "dry_run": dry_run,
-    }
-
-    return PipelineResult(
-        status="ok",
-        artifacts=artifacts,
-        receipts=receipts,
-        logs=[log for log in logs if log],
-        data={
-            "version": receipts["version"],
-            "build": build_receipt,
-            "tests": tests_receipt,
-            "workflow": workflow_receipt,
-        },
+    test_receipt = _run_release_tests(
+        command=_pytest_command(pkg.project, "-q", concurrent_suites=concurrent_suites),
+        cwd=workspace_root / pkg.project,
     )
+    package_receipts["tests"] = test_receipt
+    _collect_logs(logs, test_receipt)
+    return built_wheels, package_receipts, logs
 
 
 def _pipeline_terminal_release(context: PipelineContext) -> PipelineResult:
-    workspace_root = context.workspace_root
-    timestamp_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    packages = [
-        {
-            "name": "aware-terminal",
-            "project": workspace_root / "tools" / "terminal",
-            "out_dir": workspace_root / "build" / "public" / "aware-terminal" / "dist",
-            "test_command": [
-                "uv",
-                "run",
-                "--project",
-                "tools/terminal",
-                "pytest",
-                "-q",
-            ],
-        },
-        {
-            "name": "aware-terminal-providers",
-            "project": workspace_root / "libs" / "providers" / "terminal",
-            "out_dir": workspace_root / "build" / "public" / "aware-terminal-providers" / "dist",
-            "test_command": [
-                "uv",
-                "run",
-                "--project",
-                "libs/providers/terminal",
-                "pytest",
-                "-q",
-            ],
-        },
-    ]
+    timestamp_iso = _now_iso()
 
+    packages = list(_TERMINAL_PACKAGES)
     if _to_bool(context.get("include-control-center")):
-        packages.append(
-            {
-                "name": "aware-terminal-control-center",
-                "project": workspace_root / "tools" / "terminal-control-center",
-                "out_dir": workspace_root / "build" / "public" / "aware-terminal-control-center" / "dist",
-                "test_command": [
-                    "uv",
-                    "run",
-                    "--project",
-                    "tools/terminal-control-center",
-                    "pytest",
-                    "-q",
-                ],
-            }
-        )
+        packages.append(_TERMINAL_CONTROL_CENTER)
 
     artifacts: Dict[str, object] = {"wheels": {}}
     receipts: Dict[str, object] = {}
@@ -1379,45 +1558,33 @@ def _pipeline_terminal_release(context: PipelineContext) -> PipelineResult:
 
     skip_tests = _to_bool(context.get("skip-tests"))
 
-    for pkg in packages:
-        project_rel = pkg["project"].relative_to(workspace_root)
-        out_rel = pkg["out_dir"].relative_to(workspace_root)
-        built_wheels, build_receipt = _run_uv_build(
-            workspace_root=workspace_root,
-            project=str(project_rel),
-            out_dir=str(out_rel),
-            extra_args=[],
-        )
-        artifacts["wheels"][pkg["name"]] = built_wheels
-        receipts[pkg["name"]] = {"build": build_receipt}
-        if build_receipt.get("stdout"):
-            logs.append(build_receipt["stdout"])
-        if build_receipt.get("stderr"):
-            logs.append(build_receipt["stderr"])
-
-        if skip_tests:
-            receipts[pkg["name"]]["tests"] = {
-                "status": "skipped",
-                "reason": "skip-tests flag enabled",
-                "timestamp": timestamp_iso,
-            }
-            continue
+    # Packages share no state and each build/test is a uv subprocess, so by default they run side by side;
+    # AWARE_RELEASE_PARALLEL=0 keeps the old one-after-another order for debugging.
+    if len(packages) > 1 and os.environ.get("AWARE_RELEASE_PARALLEL", "1").strip() != "0":
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(packages)) as executor:
+            futures = [
+                executor.submit(
+                    _build_and_test_package, pkg, context, skip_tests, timestamp_iso, len(packages)
+                )
+                for pkg in packages
+            ]
+            outcomes = [future.result() for future in futures]
+    else:
+        outcomes = [_build_and_test_package(pkg, context, skip_tests, timestamp_iso) for pkg in packages]
 
-        test_receipt = _run_release_tests(
-            command=pkg["test_command"],
-            cwd=pkg["project"],
-        )
-        receipts[pkg["name"]]["tests"] = test_receipt
-        if test_receipt.get("stdout"):
-            logs.append(test_receipt["stdout"])
-        if test_receipt.get("stderr"):
-            logs.append(test_receipt["stderr"])
+    # Merge in declaration order so receipts and logs read the same either way.
+    for pkg, (built_wheels, package_receipts, package_logs) in zip(packages, outcomes):
+        artifacts["wheels"][pkg.name] = built_wheels
+        receipts[pkg.name] = package_receipts
+        logs.extend(package_logs)
 
     return PipelineResult(
         status="ok",
         artifacts=artifacts,
         receipts=receipts,
-        logs=[log for log in logs if log],
+        logs=logs,
     )
 
 
@@ -1438,6 +1605,10 @@ def _register_builtin_pipelines() -> None:
                 "workflow-dry-run": PipelineInputSpec(
                     description="Publish workflow dry-run (true/false)", default="true"
                 ),
+                "reuse-build": PipelineInputSpec(
+                    description="Reuse the last wheel if project sources and uv.lock are unchanged (true/false)",
+                    default="false",
+                ),
                 "dry-run": PipelineInputSpec(description="Pipeline dry-run (true/false)", default="false"),
             },
             artifacts=["wheels", "version"],
@@ -1461,6 +1632,13 @@ def _register_builtin_pipelines() -> None:
                 "workflow-dry-run": PipelineInputSpec(
                     description="Publish workflow dry-run (true/false)", default="true"
                 ),
+                "serial-release": PipelineInputSpec(
+                    description="Run the build and tests one after the other (true/false)", default="false"
+                ),
+                "reuse-build": PipelineInputSpec(
+                    description="Reuse the last wheel if project sources and uv.lock are unchanged (true/false)",
+                    default="false",
+                ),
                 "dry-run": PipelineInputSpec(description="Pipeline dry-run (true/false)", default="false"),
             },
             artifacts=["wheels"],
@@ -1484,6 +1662,13 @@ def _register_builtin_pipelines() -> None:
                 "workflow-dry-run": PipelineInputSpec(
                     description="Publish workflow dry-run (true/false)", default="true"
                 ),
+                "serial-release": PipelineInputSpec(
+                    description="Run the build and tests one after the other (true/false)", default="false"
+                ),
+                "reuse-build": PipelineInputSpec(
+                    description="Reuse the last wheel if project sources and uv.lock are unchanged (true/false)",
+                    default="false",
+                ),
                 "dry-run": PipelineInputSpec(description="Pipeline dry-run (true/false)", default="false"),
             },
             artifacts=["wheels"],
@@ -1507,6 +1692,10 @@ def _register_builtin_pipelines() -> None:
                 "workflow-dry-run": PipelineInputSpec(
                     description="Publish workflow dry-run (true/false)", default="true"
                 ),
+                "reuse-build": PipelineInputSpec(
+                    description="Reuse the last wheel if project sources and uv.lock are unchanged (true/false)",
+                    default="false",
+                ),
                 "dry-run": PipelineInputSpec(description="Pipeline dry-run (true/false)", default="false"),
             },
             artifacts=["wheels"],
@@ -1648,5 +1837,7 @@ __all__ = [
     "PipelineSpec",
     "get_pipeline",
     "list_pipelines",
+    "list_pipelines_dumped",
     "register_pipeline",
+    "resolve_pipeline_inputs",
 ]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import datetime as _dt
+import os
 import re
+import shutil
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional
 
@@ -32,21 +35,53 @@ class VersionConfig:
         changelog: str = "CHANGELOG.md",
         pyproject: str = "pyproject.toml",
     ) -> "VersionConfig":
-        root = project_root.resolve()
+        # Anchor relative roots at the cwd first so the cache key stays unambiguous.
+        anchored = Path(os.path.abspath(project_root))
+        root, pyproject_path, module_path, changelog_path = _resolve_project_paths(
+            anchored, module_relpath, changelog, pyproject
+        )
         return cls(
             project_root=root,
-            pyproject_path=(root / pyproject).resolve(),
-            module_path=(root / module_relpath).resolve(),
-            changelog_path=(root / changelog).resolve(),
+            pyproject_path=pyproject_path,
+            module_path=module_path,
+            changelog_path=changelog_path,
         )
 
 
+@lru_cache(maxsize=64)
+def _resolve_project_paths(
+    project_root: Path,
+    module_relpath: str,
+    changelog: str,
+    pyproject: str,
+) -> tuple[Path, Path, Path, Path]:
+    root = project_root.resolve()
+    return (
+        root,
+        (root / pyproject).resolve(),
+        (root / module_relpath).resolve(),
+        (root / changelog).resolve(),
+    )
+
+
 def read_version(config: VersionConfig) -> str:
-    data = tomllib.loads(config.pyproject_path.read_text(encoding="utf-8"))
+    st = os.stat(config.pyproject_path)
+    return _read_pyproject_version(config.pyproject_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=64)
+def _read_pyproject_text(pyproject_path: Path, mtime_ns: int, size: int) -> str:
+    # Keyed like _read_pyproject_version so reading then bumping the version reads the file once.
+    return pyproject_path.read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=64)
+def _read_pyproject_version(pyproject_path: Path, mtime_ns: int, size: int) -> str:
+    data = tomllib.loads(_read_pyproject_text(pyproject_path, mtime_ns, size))
     try:
         version = data["project"]["version"]
     except KeyError as exc:  # pragma: no cover - configuration error
-        raise KeyError(f"Missing [project].version in {config.pyproject_path}") from exc
+        raise KeyError(f"Missing [project].version in {pyproject_path}") from exc
     return str(version)
 
 
@@ -71,8 +106,11 @@ def bump_version(version: str, bump: str = "patch") -> str:
 
 
 def write_version(config: VersionConfig, new_version: str) -> None:
-    _write_pyproject_version(config.pyproject_path, new_version)
-    _write_module_version(config.module_path, new_version)
+    pyproject_text = _render_pyproject_version(config.pyproject_path, new_version)
+    module_text = _render_module_version(config.module_path, new_version)
+    config.pyproject_path.write_text(pyproject_text, encoding="utf-8")
+    config.module_path.write_text(module_text, encoding="utf-8")
+    _forget_pyproject()
 
 
 def update_changelog(
@@ -81,6 +119,61 @@ def update_changelog(
     timestamp: _dt.datetime,
     summary_lines: Optional[Iterable[str]] = None,
 ) -> str:
+    content, entry = _render_changelog(config, new_version, timestamp, summary_lines)
+    if content is not None:
+        config.changelog_path.write_text(content, encoding="utf-8")
+    return entry
+
+
+def apply_version_bump(
+    config: VersionConfig,
+    new_version: str,
+    timestamp: _dt.datetime,
+    summary_lines: Optional[Iterable[str]] = None,
+) -> str:
+    """``write_version`` plus ``update_changelog`` as one step; returns the changelog entry.
+
+    All three files are rendered before anything is written, and each is swapped in with
+    ``os.replace``, so a missing version field leaves the project untouched instead of half-bumped.
+    """
+
+    writes = [
+        (config.pyproject_path, _render_pyproject_version(config.pyproject_path, new_version)),
+        (config.module_path, _render_module_version(config.module_path, new_version)),
+    ]
+    changelog_text, entry = _render_changelog(config, new_version, timestamp, summary_lines)
+    if changelog_text is not None:
+        writes.append((config.changelog_path, changelog_text))
+    _replace_files(writes)
+    _forget_pyproject()
+    return entry
+
+
+def _replace_files(writes: Iterable[tuple[Path, str]]) -> None:
+    staged: List[tuple[Path, Path]] = []
+    try:
+        for path, content in writes:
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            staged.append((tmp_path, path))
+            tmp_path.write_text(content, encoding="utf-8")
+            if path.exists():
+                shutil.copymode(path, tmp_path)
+    except BaseException:
+        for tmp_path, _ in staged:
+            tmp_path.unlink(missing_ok=True)
+        raise
+    for tmp_path, path in staged:
+        os.replace(tmp_path, path)
+
+
+def _render_changelog(
+    config: VersionConfig,
+    new_version: str,
+    timestamp: _dt.datetime,
+    summary_lines: Optional[Iterable[str]],
+) -> tuple[Optional[str], str]:
+    """Return ``(new_content, entry)``; ``new_content`` is None when the entry already exists."""
+
     existing_text = config.changelog_path.read_text(encoding="utf-8") if config.changelog_path.exists() else ""
     summary = list(summary_lines or [])
 
@@ -88,39 +181,35 @@ def update_changelog(
     header = f"## [{new_version}] - {timestamp_str}"
 
     if _has_changelog_entry(existing_text, new_version):
-        return header  # entry already present; return header for idempotency
+        return None, header  # entry already present; return header for idempotency
 
+    # One pass over the lines: the new entry goes after the (rebuilt) Unreleased section,
+    # or before the first release heading when there is no Unreleased section.
+    lines = existing_text.split("\n")
     marker = "## [Unreleased]"
-    marker_idx = existing_text.find(marker)
-    insert_idx = len(existing_text.rstrip())
-    if marker_idx != -1:
-        prefix = existing_text[:marker_idx]
-        marker_end = marker_idx + len(marker)
-        next_heading = existing_text.find("\n##", marker_end)
-        if next_heading == -1:
-            next_heading = len(existing_text)
-        unreleased_body = existing_text[marker_end:next_heading]
-        extracted, remainder = _split_unreleased_section(unreleased_body)
+    marker_line = next((index for index, line in enumerate(lines) if line.startswith(marker)), None)
+    if marker_line is not None:
+        next_heading = next(
+            (index for index in range(marker_line + 1, len(lines)) if lines[index].startswith("##")),
+            len(lines),
+        )
+        extracted, remainder = _split_unreleased_section(
+            [lines[marker_line][len(marker):], *lines[marker_line + 1 : next_heading]]
+        )
         if extracted:
             summary = _combine_summary_lines(summary, extracted)
+        before_lines = lines[:marker_line]
         cleaned = remainder.strip("\n")
-        suffix = existing_text[next_heading:]
         if cleaned:
-            rebuilt_unreleased = f"{marker}\n{cleaned}\n"
-            existing_text = prefix + rebuilt_unreleased + suffix
-            insert_idx = len(prefix + rebuilt_unreleased)
-        else:
-            existing_text = prefix + suffix
-            insert_idx = len(prefix)
+            before_lines.extend((marker, cleaned))
+        after_lines = lines[next_heading:]
     else:
         heading_match = _CHANGELOG_HEADER_RE.search(existing_text)
-        if heading_match:
-            insert_idx = heading_match.start()
-        else:
-            insert_idx = len(existing_text.rstrip())
+        first_heading = existing_text.count("\n", 0, heading_match.start()) if heading_match else len(lines)
+        before_lines, after_lines = lines[:first_heading], lines[first_heading:]
 
-    before = existing_text[:insert_idx].rstrip("\n")
-    after = existing_text[insert_idx:].lstrip("\n")
+    before = "\n".join(before_lines).strip()
+    after = "\n".join(after_lines).strip()
 
     if not summary:
         summary = ["Automated release."]
@@ -129,15 +218,14 @@ def update_changelog(
     entry_block = f"{header}\n{bullets}"
 
     pieces: List[str] = []
-    if before.strip():
-        pieces.append(before.strip())
+    if before:
+        pieces.append(before)
     pieces.append(entry_block)
-    if after.strip():
-        pieces.append(after.strip())
+    if after:
+        pieces.append(after)
 
     new_content = "\n\n".join(pieces).strip() + "\n"
-    config.changelog_path.write_text(new_content, encoding="utf-8")
-    return entry_block + "\n"
+    return new_content, entry_block + "\n"
 
 
 def validate_changelog_format(path: Path) -> List[str]:
@@ -154,20 +242,25 @@ def validate_changelog_format(path: Path) -> List[str]:
     return warnings
 
 
-def _write_pyproject_version(pyproject_path: Path, new_version: str) -> None:
-    content = pyproject_path.read_text(encoding="utf-8")
+def _render_pyproject_version(pyproject_path: Path, new_version: str) -> str:
+    st = os.stat(pyproject_path)
+    content = _read_pyproject_text(pyproject_path, st.st_mtime_ns, st.st_size)
     if not _VERSION_RE.search(content):
         raise ValueError(f"Unable to locate version field in {pyproject_path}")
-    updated = _VERSION_RE.sub(f'version = "{new_version}"', content, count=1)
-    pyproject_path.write_text(updated, encoding="utf-8")
+    return _VERSION_RE.sub(f'version = "{new_version}"', content, count=1)
+
+
+def _forget_pyproject() -> None:
+    # A same-size rewrite can land within one mtime tick, so don't rely on the key alone.
+    _read_pyproject_text.cache_clear()
+    _read_pyproject_version.cache_clear()
 
 
-def _write_module_version(module_path: Path, new_version: str) -> None:
+def _render_module_version(module_path: Path, new_version: str) -> str:
     content = module_path.read_text(encoding="utf-8")
     if not _MODULE_VERSION_RE.search(content):
         raise ValueError(f"Unable to locate __version__ assignment in {module_path}")
-    updated = _MODULE_VERSION_RE.sub(rf'\1"{new_version}"', content, count=1)
-    module_path.write_text(updated, encoding="utf-8")
+    return _MODULE_VERSION_RE.sub(rf'\1"{new_version}"', content, count=1)
 
 
 def _normalize_version_label(label: str) -> str:
@@ -182,10 +275,10 @@ def _has_changelog_entry(content: str, version: str) -> bool:
     return False
 
 
-def _split_unreleased_section(section: str) -> tuple[list[str], str]:
+def _split_unreleased_section(section: Iterable[str]) -> tuple[list[str], str]:
     bullet_items: list[str] = []
     remaining_lines: list[str] = []
-    for raw_line in section.splitlines():
+    for raw_line in section:
         stripped = raw_line.strip()
         if stripped.startswith("- "):
             bullet_items.append(stripped[2:].strip())
@@ -196,11 +289,12 @@ def _split_unreleased_section(section: str) -> tuple[list[str], str]:
 
 
 _MARKDOWN_STRIP_RE = re.compile(r"[`*_]")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _normalize_summary_line(line: str) -> str:
     cleaned = _MARKDOWN_STRIP_RE.sub("", line.strip())
-    cleaned = re.sub(r"\s+", " ", cleaned)
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned)
     return cleaned.strip(" .").lower()
 
 
@@ -1,3 +1,3 @@
-from .registry import WORKFLOWS, get_workflow, list_workflows
+from .registry import WORKFLOWS, get_workflow, list_workflows, list_workflows_dumped
 
-__all__ = ["WORKFLOWS", "get_workflow", "list_workflows"]
+__all__ = ["WORKFLOWS", "get_workflow", "list_workflows", "list_workflows_dumped"]
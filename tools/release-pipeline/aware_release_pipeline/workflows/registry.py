@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Iterable
 
 from aware_release.workflows import WorkflowInputSpec, WorkflowSpec
@@ -117,13 +118,23 @@ WORKFLOWS: Dict[str, WorkflowSpec] = {
 
 
 def get_workflow(slug: str) -> WorkflowSpec:
+    """Return the registry entry for *slug*; it is shared, so treat it as read-only."""
+
     try:
-        return WORKFLOWS[slug].model_copy()
+        return WORKFLOWS[slug]
     except KeyError as exc:  # pragma: no cover - exercised via CLI error handling
         available = ", ".join(sorted(WORKFLOWS))
         raise KeyError(f"Unknown workflow slug '{slug}'. Available workflows: {available}.") from exc
 
 
 def list_workflows() -> Iterable[WorkflowSpec]:
-    for spec in WORKFLOWS.values():
-        yield spec.model_copy()
+    """Yield the shared registry entries; use ``model_copy(update=...)`` to derive a variant."""
+
+    yield from WORKFLOWS.values()
+
+
+@lru_cache(maxsize=1)
+def list_workflows_dumped() -> tuple[dict[str, object], ...]:
+    """JSON-ready form of the static workflow registry, computed on first use; treat it as read-only."""
+
+    return tuple(spec.model_dump(mode="json") for spec in WORKFLOWS.values())
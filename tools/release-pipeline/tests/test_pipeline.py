@@ -4,6 +4,7 @@ import json
 import os
 import subprocess
 import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -13,6 +14,7 @@ ROOT = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(ROOT / "tools" / "release"))
 sys.path.insert(0, str(ROOT / "tools" / "release-pipeline"))
 
+import aware_release_pipeline.pipelines as pipelines_mod
 from aware_release_pipeline.pipeline import prepare_release, publish_release
 from aware_release_pipeline.pipelines import PipelineContext
 
@@ -45,6 +47,42 @@ def sample_workspace(tmp_path: Path) -> Path:
     return tmp_path
 
 
+class FakeReleaseSteps:
+    """Stands in for the uv build and release-test subprocesses, recording what each one received."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.builds: list[dict[str, object]] = []
+        self.test_envs: list[dict[str, str] | None] = []
+        # When set, a build waits for a test run to start, so overlapping steps can be observed.
+        self.hold_builds = False
+        self.overlapped = False
+        self._tests_started = threading.Event()
+
+    def build(self, **kwargs: object) -> tuple[list[str], dict[str, object]]:
+        project = str(kwargs["project"])
+        self.calls.append(f"build {project}")
+        self.builds.append(kwargs)
+        if self.hold_builds:
+            self.overlapped = self._tests_started.wait(timeout=5)
+        return [f"{project}.whl"], {"status": "ok", "stdout": f"built {project}"}
+
+    def tests(self, command: list[str], cwd: Path, env: dict[str, str] | None = None) -> dict[str, object]:
+        project = command[command.index("--project") + 1] if "--project" in command else str(cwd)
+        self.calls.append(f"tests {project}")
+        self.test_envs.append(env)
+        self._tests_started.set()
+        return {"returncode": 0, "stdout": f"tested {project}", "stderr": ""}
+
+
+@pytest.fixture()
+def fake_release_steps(monkeypatch: pytest.MonkeyPatch) -> FakeReleaseSteps:
+    steps = FakeReleaseSteps()
+    monkeypatch.setattr(pipelines_mod, "_run_uv_build", steps.build)
+    monkeypatch.setattr(pipelines_mod, "_run_release_tests", steps.tests)
+    return steps
+
+
 def test_prepare_release_returns_bundle(sample_workspace: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     payload = prepare_release(
         channel="dev",
@@ -59,6 +97,8 @@ def test_prepare_release_returns_bundle(sample_workspace: Path, monkeypatch: pyt
     assert manifest_path.exists()
     archive_path = Path(payload.archive_path)
     assert archive_path.exists()
+    assert payload.manifest["channel"] == "dev"
+    assert payload.to_dict()["manifest"] is payload.manifest
 
 
 def test_publish_release_noop(sample_workspace: Path) -> None:
@@ -171,8 +211,9 @@ def test_cli_rules_render(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsy
         )
 
     import aware_release_pipeline.cli as pipeline_cli
+    import aware_release_pipeline.pipeline as pipeline_steps
 
-    monkeypatch.setattr(pipeline_cli, "render_rules", fake_render_rules)
+    monkeypatch.setattr(pipeline_steps, "render_rules", fake_render_rules)
 
     exit_code = pipeline_cli.main(
         [
@@ -280,6 +321,7 @@ def test_cli_sdk_publish(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Non
     monkeypatch.setattr(pipeline_cli, "_run_sdk_pipeline", fake_pipeline)
     monkeypatch.setattr(pipeline_cli, "_sync_sdk_export", fake_sync)
     monkeypatch.setattr(pipeline_cli, "_run_git_command", fake_git)
+    monkeypatch.setattr(pipeline_cli, "_git_has_changes", lambda cwd: True)
 
     payload = pipeline_cli._publish_sdk_export(
         workspace_root=str(tmp_path),
@@ -304,6 +346,35 @@ def test_cli_sdk_publish(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Non
     assert ("git", "push", "origin", "main") in git_commands
 
 
+def test_cli_sniff_subcommand() -> None:
+    import aware_release_pipeline.cli as pipeline_cli
+
+    assert pipeline_cli._sniff_subcommand(["pipeline", "list"]) == "pipeline"
+    assert pipeline_cli._sniff_subcommand(["prepare", "--channel", "dev"]) == "prepare"
+    assert pipeline_cli._sniff_subcommand(["--help"]) is None
+    assert pipeline_cli._sniff_subcommand(["unknown"]) is None
+    assert pipeline_cli._sniff_subcommand([]) is None
+
+
+def test_git_has_changes(tmp_path: Path) -> None:
+    import aware_release_pipeline.cli as pipeline_cli
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    assert pipeline_cli._git_has_changes(tmp_path) is False
+    _touch_file(tmp_path / "README.md", "hello")
+    assert pipeline_cli._git_has_changes(tmp_path) is True
+
+
+def test_git_has_changes_raises_when_git_fails(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import aware_release_pipeline.cli as pipeline_cli
+
+    outside = tmp_path / "not-a-repo"
+    outside.mkdir()
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+    with pytest.raises(subprocess.CalledProcessError):
+        pipeline_cli._git_has_changes(outside)
+
+
 def test_terminal_release_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     import aware_release_pipeline.pipelines as pipelines_mod
 
@@ -429,11 +500,8 @@ def test_pipeline_cli_release_e2e(monkeypatch: pytest.MonkeyPatch, tmp_path: Pat
         order.append('bump-version')
         return '0.1.1'
 
-    def fake_write_version(cfg, version):
-        order.append('write-version')
-
-    def fake_update_changelog(cfg, version, ts, summary):
-        order.append('changelog')
+    def fake_apply_version_bump(cfg, version, ts, summary):
+        order.append('apply-version-bump')
         return 'entry'
 
     def fake_uv_build(**kwargs):
@@ -485,13 +553,12 @@ def test_pipeline_cli_release_e2e(monkeypatch: pytest.MonkeyPatch, tmp_path: Pat
 
     monkeypatch.setattr(pipelines_mod, "read_version", fake_read_version)
     monkeypatch.setattr(pipelines_mod, "bump_version", fake_bump_version)
-    monkeypatch.setattr(pipelines_mod, "write_version", fake_write_version)
-    monkeypatch.setattr(pipelines_mod, "update_changelog", fake_update_changelog)
+    monkeypatch.setattr(pipelines_mod, "apply_version_bump", fake_apply_version_bump)
     monkeypatch.setattr(pipelines_mod, "_run_uv_build", fake_uv_build)
     monkeypatch.setattr(pipelines_mod, "_pipeline_cli_bundle", fake_bundle)
     monkeypatch.setattr(pipelines_mod, "_pipeline_rules_version", fake_rules)
     monkeypatch.setattr(pipelines_mod, "_run_release_tests", fake_tests)
-    monkeypatch.setattr(pipelines_mod, "trigger_workflow", fake_trigger)
+    monkeypatch.setattr("aware_release.workflows.trigger_workflow", fake_trigger)
     monkeypatch.setattr(pipelines_mod, "publish_awarerelease_pypi", fake_publish)
 
     context = PipelineContext(
@@ -507,7 +574,10 @@ def test_pipeline_cli_release_e2e(monkeypatch: pytest.MonkeyPatch, tmp_path: Pat
     result = pipelines_mod._pipeline_cli_release_e2e(context)
 
     assert result.status == "ok"
-    assert order == ["read-version", "bump-version", "write-version", "changelog", "build", "bundle", "rules", "tests", "workflow", "publish"]
+    assert order[:4] == ["read-version", "bump-version", "apply-version-bump", "build"]
+    # Bundle and rules run concurrently, so only their combined slot is ordered.
+    assert sorted(order[4:6]) == ["bundle", "rules"]
+    assert order[6:] == ["tests", "workflow", "publish"]
     assert result.receipts["build"]["status"] == "ok"
     assert result.receipts["version"]["new"] == "0.1.1"
     assert result.receipts["bundle"]["prepare"]["manifest_path"] == "manifest.json"
@@ -551,12 +621,11 @@ def test_environment_release_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path:
 
     monkeypatch.setattr(pipelines_mod, "_run_uv_build", fake_build)
     monkeypatch.setattr(pipelines_mod, "_run_release_tests", fake_tests)
-    monkeypatch.setattr(pipelines_mod, "get_workflow", fake_get_workflow)
-    monkeypatch.setattr(pipelines_mod, "trigger_workflow", fake_trigger)
+    monkeypatch.setattr("aware_release_pipeline.workflows.get_workflow", fake_get_workflow)
+    monkeypatch.setattr("aware_release.workflows.trigger_workflow", fake_trigger)
     monkeypatch.setattr(pipelines_mod, "read_version", lambda cfg: "0.1.0")
     monkeypatch.setattr(pipelines_mod, "bump_version", lambda version, bump: "0.1.1")
-    monkeypatch.setattr(pipelines_mod, "write_version", lambda cfg, version: None)
-    monkeypatch.setattr(pipelines_mod, "update_changelog", lambda cfg, version, ts, summary: "entry")
+    monkeypatch.setattr(pipelines_mod, "apply_version_bump", lambda cfg, version, ts, summary: "entry")
 
     context = pipelines_mod.PipelineContext(
         workspace_root=tmp_path,
@@ -584,7 +653,7 @@ def test_cli_terminal_refresh(monkeypatch: pytest.MonkeyPatch, capsys: pytest.Ca
             logs=["refreshed"],
         )
 
-    monkeypatch.setattr("aware_release_pipeline.cli.refresh_terminal_providers", fake_refresh)
+    monkeypatch.setattr("aware_release_pipeline.pipeline.refresh_terminal_providers", fake_refresh)
 
     exit_code = pipeline_cli.main(
         [
@@ -609,7 +678,7 @@ def test_cli_terminal_validate(monkeypatch: pytest.MonkeyPatch, capsys: pytest.C
             timestamp=datetime.now(timezone.utc),
         )
 
-    monkeypatch.setattr("aware_release_pipeline.cli.validate_terminal_providers", fake_validate)
+    monkeypatch.setattr("aware_release_pipeline.pipeline.validate_terminal_providers", fake_validate)
 
     exit_code = pipeline_cli.main(
         [
@@ -633,8 +702,9 @@ def test_cli_aware_release_publish_pypi(monkeypatch: pytest.MonkeyPatch, capsys:
         }
 
     import aware_release_pipeline.cli as pipeline_cli
+    import aware_release_pipeline.pipeline as pipeline_steps
 
-    monkeypatch.setattr(pipeline_cli, "publish_awarerelease_pypi", fake_publish)
+    monkeypatch.setattr(pipeline_steps, "publish_awarerelease_pypi", fake_publish)
 
     repo_root = Path(__file__).resolve().parents[3]
     pyproject_path = repo_root / "tools" / "release" / "pyproject.toml"
@@ -653,3 +723,537 @@ def test_cli_aware_release_publish_pypi(monkeypatch: pytest.MonkeyPatch, capsys:
     assert exit_code == 0
     payload = json.loads(captured.out)
     assert payload["published"] is False
+
+
+def test_list_pipelines_dumped_tracks_registrations(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pipelines_mod, "_PIPELINES", dict(pipelines_mod._PIPELINES))
+    monkeypatch.setattr(pipelines_mod, "_PIPELINE_DICTS", None)
+
+    before = pipelines_mod.list_pipelines_dumped()
+    assert pipelines_mod.list_pipelines_dumped() is before
+
+    pipelines_mod.register_pipeline(
+        pipelines_mod.PipelineSpec(slug="dummy", description="Dummy", runner=lambda context: None)
+    )
+    after = pipelines_mod.list_pipelines_dumped()
+    assert [entry["slug"] for entry in after][-1] == "dummy"
+    assert len(after) == len(before) + 1
+
+
+def test_resolve_pipeline_inputs_uses_defaults_and_keeps_extras() -> None:
+    spec = pipelines_mod.PipelineSpec(
+        slug="resolve-demo",
+        description="Demo",
+        runner=lambda context: None,
+        inputs={
+            "channel": pipelines_mod.PipelineInputSpec(description="", default="dev"),
+            "version": pipelines_mod.PipelineInputSpec(description="", required=True),
+            "platforms": pipelines_mod.PipelineInputSpec(description="", multiple=True, default=["linux", 1]),
+        },
+    )
+
+    resolved = pipelines_mod.resolve_pipeline_inputs(spec, {"version": ["1.0", "1.1"], "extra": ["x"]})
+    assert resolved == {"channel": "dev", "version": "1.1", "platforms": ["linux", "1"], "extra": "x"}
+
+    with pytest.raises(ValueError):
+        pipelines_mod.resolve_pipeline_inputs(spec, {})
+
+    # Each spec object carries its own plan, whatever its slug.
+    other = pipelines_mod.PipelineSpec(
+        slug="resolve-demo",
+        description="Demo",
+        runner=lambda context: None,
+        inputs={"channel": pipelines_mod.PipelineInputSpec(description="", default="stable")},
+    )
+    assert pipelines_mod.resolve_pipeline_inputs(other, {}) == {"channel": "stable"}
+    assert pipelines_mod.resolve_pipeline_inputs(spec, {"version": ["2.0"]})["channel"] == "dev"
+
+
+def test_refresh_terminal_providers_runs_updater_from_scripts_dir(tmp_path: Path) -> None:
+    from aware_release_pipeline.pipeline import refresh_terminal_providers
+
+    scripts_dir = tmp_path / "libs" / "providers" / "terminal" / "scripts"
+    scripts_dir.mkdir(parents=True)
+    updater = scripts_dir / "update_provider_versions.py"
+    updater.write_text(
+        "import os, sys\n"
+        "print('args', ' '.join(sys.argv[1:]))\n"
+        "print('cwd', os.path.basename(os.getcwd()))\n",
+        encoding="utf-8",
+    )
+    manifests = tmp_path / "manifests"
+    (manifests / "codex").mkdir(parents=True)
+    (manifests / "codex" / "releases.json").write_text("{}", encoding="utf-8")
+
+    result = refresh_terminal_providers(workspace_root=tmp_path, manifests_dir=manifests)
+    assert result.logs == ["args --write --verbose\ncwd scripts\n"]
+    assert result.providers_changed == ["codex"]
+
+    updater.write_text("import sys\nprint('boom', file=sys.stderr)\nsys.exit(3)\n", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="exit code 3: boom"):
+        refresh_terminal_providers(workspace_root=tmp_path, manifests_dir=manifests)
+
+
+def test_read_json_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    from aware_release_pipeline.pipeline import _read_json
+
+    manifest = tmp_path / "releases.json"
+    manifest.write_text('{"channels": {}}', encoding="utf-8")
+    first = _read_json(manifest)
+    assert _read_json(manifest) is first
+
+    # Same size and the same mtime: only the content changed.
+    stat = manifest.stat()
+    manifest.write_text('{"channels": []}', encoding="utf-8")
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert _read_json(manifest) == {"channels": []}
+
+
+def test_validate_terminal_providers_reports_issues_in_path_order(tmp_path: Path) -> None:
+    from aware_release_pipeline.pipeline import validate_terminal_providers
+
+    manifests = {
+        "alpha": {"channels": {"stable": {"version": "1.0.0"}}},
+        "beta": {"versions": [{"tag": "latest", "version": "1.0"}, {"tag": "latest", "version": "2.0"}]},
+        "gamma": {"channels": {}},
+        "delta": ["not", "an", "object"],
+    }
+    for name, payload in manifests.items():
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "releases.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    result = validate_terminal_providers(workspace_root=tmp_path, manifests_dir=tmp_path)
+
+    assert [Path(path).parent.name for path in result.manifest_paths] == ["alpha", "beta", "delta", "gamma"]
+    assert [(Path(issue.manifest).parent.name, issue.message) for issue in result.issues] == [
+        ("beta", "Tag 'latest' mapped to conflicting versions (1.0 vs 2.0)."),
+        ("delta", "Manifest must be a JSON object."),
+        ("gamma", "Manifest 'channels' must be a non-empty object."),
+    ]
+
+
+def test_copy_tree_skips_caches_and_preserves_layout(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    (src / "pkg" / "__pycache__").mkdir(parents=True)
+    (src / "pkg" / "__pycache__" / "mod.cpython-312.pyc").write_bytes(b"\x00")
+    (src / "pkg" / "mod.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (src / "demo.egg-info").mkdir()
+    (src / "demo.egg-info" / "PKG-INFO").write_text("Name: demo\n", encoding="utf-8")
+    (src / ".git").mkdir()
+    (src / "README.md").write_text("readme\n", encoding="utf-8")
+
+    dst = tmp_path / "dst"
+    (dst / "stale").mkdir(parents=True)
+    pipelines_mod._copy_tree(src, dst)
+
+    copied = sorted(path.relative_to(dst).as_posix() for path in dst.rglob("*"))
+    assert copied == ["README.md", "pkg", "pkg/mod.py"]
+    assert (dst / "pkg" / "mod.py").read_text(encoding="utf-8") == "VALUE = 1\n"
+
+
+def test_run_captured_tail_keeps_last_lines(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pipelines_mod, "_OUTPUT_TAIL_LINES", 3)
+    script = "import sys\nfor i in range(10):\n    print(i)\nprint('err', file=sys.stderr)\nsys.exit(4)\n"
+    returncode, stdout, stderr = pipelines_mod._run_captured_tail([sys.executable, "-c", script], cwd=tmp_path)
+
+    assert returncode == 4
+    assert stdout == "7\n8\n9\n"
+    assert stderr == "err\n"
+
+
+def test_run_release_tests_keeps_logs_only_for_failed_runs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import re
+    import tempfile
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr(pipelines_mod, "_LOG_TAIL_BYTES", 4)
+    script = "import sys\nprint('x' * 100 + 'tail')\nprint('oops', file=sys.stderr)\n"
+    result = pipelines_mod._run_release_tests([sys.executable, "-c", script], cwd=tmp_path)
+
+    assert result["returncode"] == 0
+    assert result["stdout"] == "ail\n"
+    assert list(tmp_path.glob("aware-tests-*")) == []
+
+    failing = "print('y' * 100)\nraise SystemExit(1)\n"
+    with pytest.raises(pipelines_mod.PipelineError, match="Full logs") as excinfo:
+        pipelines_mod._run_release_tests([sys.executable, "-c", failing], cwd=tmp_path)
+    stdout_log = re.search(r"Full logs: (\S+),", str(excinfo.value)).group(1)
+    assert Path(stdout_log).read_text(encoding="utf-8") == "y" * 100 + "\n"
+
+
+def test_clone_file_copies_contents_and_mode(tmp_path: Path) -> None:
+    from aware_release_pipeline.fileops import clone_file
+
+    src = tmp_path / "script.sh"
+    src.write_bytes(b"#!/bin/sh\necho hi\n" * 1000)
+    src.chmod(0o755)
+    dst = tmp_path / "copy.sh"
+
+    assert clone_file(str(src), str(dst)) == str(dst)
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mode == src.stat().st_mode
+
+
+def test_clone_file_falls_back_after_short_copy_range(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import errno
+
+    import aware_release_pipeline.fileops as fileops
+
+    src = tmp_path / "data.bin"
+    src.write_bytes(b"x" * 4096)
+    dst = tmp_path / "copy.bin"
+
+    monkeypatch.setattr(fileops, "_reflink_supported", False)
+    monkeypatch.setattr(fileops, "_copy_range_supported", None)
+    monkeypatch.setattr(fileops.os, "copy_file_range", lambda *args: 0, raising=False)
+    fileops.clone_file(str(src), str(dst))
+    assert dst.read_bytes() == src.read_bytes()
+
+    def failing_ioctl(*args):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    import fcntl
+
+    monkeypatch.setattr(fileops, "_reflink_supported", None)
+    monkeypatch.setattr(fcntl, "ioctl", failing_ioctl)
+    with pytest.raises(OSError) as excinfo:
+        fileops.clone_file(str(src), str(dst))
+    assert excinfo.value.errno == errno.ENOSPC
+    assert fileops._reflink_supported is None
+
+
+def test_run_uv_build_lists_wheels_relative_to_workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "libs" / "pkg").mkdir(parents=True)
+    dist = tmp_path / "build" / "dist"
+    dist.mkdir(parents=True)
+    for name in ("pkg-0.2.0-py3-none-any.whl", "pkg-0.1.0-py3-none-any.whl", "pkg-0.2.0.tar.gz"):
+        (dist / name).write_bytes(b"")
+    outside = tmp_path.parent / f"{tmp_path.name}-outside"
+    outside.mkdir()
+    (outside / "other-1.0-py3-none-any.whl").write_bytes(b"")
+
+    monkeypatch.setattr(pipelines_mod, "_run_captured_tail", lambda command, *, cwd, env=None: (0, "", ""))
+    wheels, receipt = pipelines_mod._run_uv_build(
+        workspace_root=tmp_path, project="libs/pkg", out_dir="build/dist", extra_args=[]
+    )
+    assert wheels == [
+        os.path.join("build", "dist", "pkg-0.1.0-py3-none-any.whl"),
+        os.path.join("build", "dist", "pkg-0.2.0-py3-none-any.whl"),
+    ]
+    assert receipt["wheels"] == wheels
+
+    wheels, _ = pipelines_mod._run_uv_build(
+        workspace_root=tmp_path, project="libs/pkg", out_dir=str(outside), extra_args=[]
+    )
+    assert wheels == [str(outside / "other-1.0-py3-none-any.whl")]
+
+
+def test_run_uv_build_reuses_cached_wheel_until_sources_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project = tmp_path / "libs" / "pkg"
+    project.mkdir(parents=True)
+    (project / "pyproject.toml").write_text("[project]\nversion = '0.1.0'\n", encoding="utf-8")
+    dist = tmp_path / "build" / "dist"
+    calls: list[list[str]] = []
+
+    def fake_tail(command, *, cwd, env=None):
+        calls.append(command)
+        (dist / "pkg-0.1.0-py3-none-any.whl").write_bytes(b"")
+        return 0, "built", ""
+
+    monkeypatch.setattr(pipelines_mod, "_run_captured_tail", fake_tail)
+
+    def build(reuse=True):
+        return pipelines_mod._run_uv_build(
+            workspace_root=tmp_path, project="libs/pkg", out_dir="build/dist", extra_args=[], reuse=reuse
+        )
+
+    wheels, receipt = build()
+    assert receipt["status"] == "ok"
+    cached_wheels, cached = build()
+    assert len(calls) == 1
+    assert cached_wheels == wheels
+    assert cached["status"] == "cached"
+    assert cached["stdout"] == ""
+
+    build(reuse=False)
+    assert len(calls) == 2
+
+    (project / "pyproject.toml").write_text("[project]\nversion = '0.1.1'\n", encoding="utf-8")
+    assert build()[1]["status"] == "ok"
+    assert len(calls) == 3
+
+    (tmp_path / "uv.lock").write_text("version = 1\n", encoding="utf-8")
+    assert build()[1]["status"] == "ok"
+    assert len(calls) == 4
+
+    (dist / "pkg-0.1.0-py3-none-any.whl").unlink()
+    assert build()[1]["status"] == "ok"
+    assert len(calls) == 5
+
+
+def test_parse_key_value_pairs() -> None:
+    assert pipelines_mod._parse_key_value_pairs([]) == {}
+    assert pipelines_mod._parse_key_value_pairs([" channel = dev ", "expr=a=b"]) == {"channel": "dev", "expr": "a=b"}
+    with pytest.raises(pipelines_mod.PipelineError, match="key=value"):
+        pipelines_mod._parse_key_value_pairs(["channel"])
+    with pytest.raises(pipelines_mod.PipelineError, match="empty"):
+        pipelines_mod._parse_key_value_pairs([" =dev"])
+
+
+def test_stage_sdk_sources_restages_incrementally(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pipelines_mod, "SDK_EXPORT_ENTRIES", [("libs/demo", "libs/demo")])
+    sdk_root = tmp_path / "apps" / "aware-sdk"
+    (sdk_root / "aware_sdk").mkdir(parents=True)
+    (sdk_root / "aware_sdk" / "__init__.py").write_text("", encoding="utf-8")
+    (sdk_root / "README.md").write_text("readme\n", encoding="utf-8")
+    demo = tmp_path / "libs" / "demo"
+    demo.mkdir(parents=True)
+    (demo / "keep.py").write_text("KEEP = 1\n", encoding="utf-8")
+    (demo / "edit.py").write_text("EDIT = 1\n", encoding="utf-8")
+    (demo / "gone.py").write_text("GONE = 1\n", encoding="utf-8")
+
+    staging = pipelines_mod._stage_sdk_sources(tmp_path)
+    keep_inode = (staging / "libs" / "demo" / "keep.py").stat().st_ino
+    (staging / "libs" / "stale").mkdir()
+    (staging / "notes.txt").write_text("leftover\n", encoding="utf-8")
+
+    (demo / "edit.py").write_text("EDIT = 22\n", encoding="utf-8")
+    (demo / "gone.py").unlink()
+    staging = pipelines_mod._stage_sdk_sources(tmp_path)
+
+    staged = sorted(path.relative_to(staging).as_posix() for path in staging.rglob("*"))
+    assert staged == [
+        "README.md",
+        "aware_sdk",
+        "aware_sdk/__init__.py",
+        "libs",
+        "libs/demo",
+        "libs/demo/edit.py",
+        "libs/demo/keep.py",
+    ]
+    assert (staging / "libs" / "demo" / "edit.py").read_text(encoding="utf-8") == "EDIT = 22\n"
+    assert (staging / "libs" / "demo" / "keep.py").stat().st_ino == keep_inode
+    assert not (tmp_path / "build" / ".sdk-export.tmp").exists()
+
+
+def test_stage_sdk_sources_reports_every_missing_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        pipelines_mod,
+        "SDK_EXPORT_ENTRIES",
+        [("libs/present", "libs/present"), ("libs/one", "libs/one"), ("libs/two", "libs/two")],
+    )
+    (tmp_path / "libs" / "present").mkdir(parents=True)
+
+    with pytest.raises(pipelines_mod.PipelineError, match="libs/one, .*libs/two$"):
+        pipelines_mod._stage_sdk_sources(tmp_path)
+    assert not (tmp_path / "build").exists()
+
+
+@pytest.mark.parametrize("bundle_outcome", ["raises", "not-ok"])
+def test_pipeline_cli_release_e2e_skips_rules_when_bundle_fails(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, bundle_outcome: str
+) -> None:
+    from aware_release_pipeline.pipelines import PipelineResult
+
+    rules_root = tmp_path / "docs" / "rules"
+
+    def bundle(context: PipelineContext) -> PipelineResult:
+        if bundle_outcome == "raises":
+            raise pipelines_mod.PipelineError("bundle broke")
+        return PipelineResult(status="failed")
+
+    def rules(context: PipelineContext) -> PipelineResult:
+        rules_root.mkdir(parents=True)
+        return PipelineResult(status="ok")
+
+    monkeypatch.setattr(pipelines_mod, "read_version", lambda cfg: "0.1.0")
+    monkeypatch.setattr(pipelines_mod, "_pipeline_cli_bundle", bundle)
+    monkeypatch.setattr(pipelines_mod, "_pipeline_rules_version", rules)
+    context = PipelineContext(
+        workspace_root=tmp_path,
+        inputs={"channel": "dev", "skip-versioning": True, "skip-build": True, "wheel": ["dist/cli.whl"]},
+        raw_inputs={},
+    )
+
+    with pytest.raises(pipelines_mod.PipelineError, match="(?i)bundle"):
+        pipelines_mod._pipeline_cli_release_e2e(context)
+    assert not rules_root.exists()
+
+
+def test_pytest_command_runs_serially_unless_workers_requested(monkeypatch: pytest.MonkeyPatch) -> None:
+    serial = ["uv", "run", "--project", "libs/demo", "pytest", "-q"]
+    monkeypatch.delenv("AWARE_PYTEST_WORKERS", raising=False)
+    assert pipelines_mod._pytest_command("libs/demo", "-q") == serial
+    monkeypatch.setenv("AWARE_PYTEST_WORKERS", "0")
+    assert pipelines_mod._pytest_command("libs/demo", "-q") == serial
+    monkeypatch.setenv("AWARE_PYTEST_WORKERS", "4")
+    assert pipelines_mod._pytest_command("libs/demo", "-q", concurrent_suites=3) == [
+        "uv", "run", "--project", "libs/demo", "--extra", "test", "pytest", "-q", "-n", "4", "--dist=loadfile",
+    ]
+
+
+def test_pytest_command_splits_auto_workers_across_concurrent_suites(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AWARE_PYTEST_WORKERS", "auto")
+    monkeypatch.setattr(pipelines_mod.os, "cpu_count", lambda: 8)
+    assert pipelines_mod._pytest_command("libs/demo", "-q")[-3:] == ["-n", "auto", "--dist=loadfile"]
+    assert pipelines_mod._pytest_command("libs/demo", "-q", concurrent_suites=3)[-3:] == ["-n", "2", "--dist=loadfile"]
+    assert pipelines_mod._pytest_command("libs/demo", "-q", concurrent_suites=5) == [
+        "uv", "run", "--project", "libs/demo", "pytest", "-q",
+    ]
+
+
+@pytest.mark.parametrize("parallel", ["1", "0"])
+def test_terminal_release_merges_packages_in_declaration_order(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, fake_release_steps: FakeReleaseSteps, parallel: str
+) -> None:
+    monkeypatch.setenv("AWARE_RELEASE_PARALLEL", parallel)
+    context = PipelineContext(workspace_root=tmp_path, inputs={"include-control-center": "true"}, raw_inputs={})
+    result = pipelines_mod._pipeline_terminal_release(context)
+
+    names = ["aware-terminal", "aware-terminal-providers", "aware-terminal-control-center"]
+    assert list(result.receipts) == names
+    assert result.artifacts["wheels"] == {
+        "aware-terminal": ["tools/terminal.whl"],
+        "aware-terminal-providers": ["libs/providers/terminal.whl"],
+        "aware-terminal-control-center": ["tools/terminal-control-center.whl"],
+    }
+    assert result.logs == [
+        "built tools/terminal",
+        "tested tools/terminal",
+        "built libs/providers/terminal",
+        "tested libs/providers/terminal",
+        "built tools/terminal-control-center",
+        "tested tools/terminal-control-center",
+    ]
+
+
+@pytest.mark.parametrize("serial", [False, True])
+def test_build_and_test_project_overlaps_unless_serial(
+    tmp_path: Path, fake_release_steps: FakeReleaseSteps, serial: bool
+) -> None:
+    # Overlapped, the build only returns once the tests have started alongside it.
+    fake_release_steps.hold_builds = not serial
+    context = PipelineContext(workspace_root=tmp_path, inputs={"serial-release": serial}, raw_inputs={})
+
+    wheels, build_receipt, tests_receipt = pipelines_mod._build_and_test_project(
+        context, project="libs/demo", out_dir="dist", timestamp_iso="2025-01-01T00:00:00Z"
+    )
+
+    assert wheels == ["libs/demo.whl"]
+    assert build_receipt["status"] == "ok"
+    assert tests_receipt["stdout"] == "tested libs/demo"
+    assert fake_release_steps.test_envs[0]["UV_NO_WORKSPACE"] == "1"
+    if serial:
+        assert fake_release_steps.calls == ["build libs/demo", "tests libs/demo"]
+    else:
+        assert fake_release_steps.overlapped
+
+
+def test_uv_env_defaults_cache_into_workspace(tmp_path: Path) -> None:
+    assert pipelines_mod._uv_env(tmp_path, {"PATH": "/bin"}) == {
+        "PATH": "/bin",
+        "UV_CACHE_DIR": str(tmp_path / ".cache" / "uv"),
+    }
+    assert pipelines_mod._uv_env(tmp_path, {"UV_CACHE_DIR": "/ci/uv"})["UV_CACHE_DIR"] == "/ci/uv"
+
+
+def test_pipeline_context_snapshots_environment_per_run(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AWARE_RELEASE_TEST_TOKEN", "first")
+    first = PipelineContext(workspace_root=tmp_path, inputs={}, raw_inputs={})
+    monkeypatch.setenv("AWARE_RELEASE_TEST_TOKEN", "second")
+    second = PipelineContext(workspace_root=tmp_path, inputs={}, raw_inputs={})
+    assert first.base_env["AWARE_RELEASE_TEST_TOKEN"] == "first"
+    assert second.base_env["AWARE_RELEASE_TEST_TOKEN"] == "second"
+    with pytest.raises(TypeError):
+        first.base_env["AWARE_RELEASE_TEST_TOKEN"] = "third"  # type: ignore[index]
+
+
+@pytest.mark.parametrize(
+    ("runner", "slug", "version_artifact"),
+    [
+        ("_pipeline_tests_release", "tests-release", True),
+        ("_pipeline_file_system_release", "file-system-release", False),
+        ("_pipeline_environment_release", "environment-release", False),
+    ],
+)
+def test_release_pipelines_share_one_flow(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    fake_release_steps: FakeReleaseSteps,
+    runner: str,
+    slug: str,
+    version_artifact: bool,
+) -> None:
+    import types
+
+    from aware_release.workflows import WorkflowDispatchResult
+
+    dispatched: list[str] = []
+
+    def fake_trigger(spec, inputs, dry_run):
+        dispatched.append(spec.slug)
+        return WorkflowDispatchResult(
+            status="dispatched", repo="repo", workflow="wf", ref="main", inputs=dict(inputs), dry_run=dry_run
+        )
+
+    monkeypatch.setattr("aware_release_pipeline.workflows.get_workflow", lambda name: types.SimpleNamespace(slug=name))
+    monkeypatch.setattr("aware_release.workflows.trigger_workflow", fake_trigger)
+    monkeypatch.setattr(pipelines_mod, "read_version", lambda cfg: "1.0.0")
+    context = PipelineContext(
+        workspace_root=tmp_path,
+        inputs={"skip-versioning": True, "skip-tests": True},
+        raw_inputs={},
+    )
+
+    result = getattr(pipelines_mod, runner)(context)
+
+    assert dispatched == [slug]
+    assert result.receipts["build"]["status"] == "ok"
+    assert result.receipts["tests"]["status"] == "skipped"
+    assert len(fake_release_steps.builds) == 1
+    assert fake_release_steps.test_envs == []
+    assert result.receipts["version"]["new"] == "1.0.0"
+    assert ("version" in result.artifacts) is version_artifact
+
+
+def test_iso_z_matches_strftime_for_whole_second_utc() -> None:
+    moment = datetime(2025, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+    assert pipelines_mod._iso_z(moment) == moment.strftime("%Y-%m-%dT%H:%M:%SZ") == "2025-03-04T05:06:07Z"
+
+
+def test_sdk_test_env_layers_defaults_caller_env_and_staging_paths(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, fake_release_steps: FakeReleaseSteps
+) -> None:
+    staging = tmp_path / "build" / "sdk-export"
+    (staging / "tools" / "terminal").mkdir(parents=True)
+
+    context = PipelineContext(
+        workspace_root=tmp_path,
+        inputs={},
+        raw_inputs={},
+        base_env={"UV_NO_WORKSPACE": "0", "AWARE_TERMINAL_ALLOW_MANIFEST_REFRESH": "0", "PYTEST_ADDOPTS": "-x"},
+    )
+    monkeypatch.setattr(pipelines_mod, "_stage_sdk_sources", lambda root: staging)
+
+    pipelines_mod._build_and_test_sdk(context, timestamp_iso="2025-01-01T00:00:00Z")
+    (captured,) = fake_release_steps.test_envs
+
+    assert captured["UV_NO_WORKSPACE"] == "0"
+    assert captured["AWARE_TERMINAL_ALLOW_MANIFEST_REFRESH"] == "1"
+    assert captured["AWARE_ROOT"] == str(staging)
+    assert captured["PYTEST_ADDOPTS"] == "-x -k 'not publish_pypi'"
+    stub = staging / "tools" / "terminal" / "_ci_update_provider_versions.py"
+    assert captured["AWARE_TERMINAL_MANIFEST_UPDATE_SCRIPT"] == str(stub)
+    assert stub.read_bytes() == pipelines_mod._PROVIDER_STUB_SCRIPT
+
+
+def test_workflow_lookups_return_shared_registry_entries() -> None:
+    from aware_release_pipeline.workflows import WORKFLOWS, get_workflow, list_workflows, list_workflows_dumped
+
+    assert get_workflow("cli-release") is WORKFLOWS["cli-release"]
+    assert list(list_workflows()) == list(WORKFLOWS.values())
+    dumped = list_workflows_dumped()
+    assert dumped is list_workflows_dumped()
+    assert [entry["slug"] for entry in dumped] == list(WORKFLOWS)
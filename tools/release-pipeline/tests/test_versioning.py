@@ -7,6 +7,7 @@ import pytest
 
 from aware_release_pipeline.versioning import (
     VersionConfig,
+    apply_version_bump,
     bump_version,
     read_version,
     update_changelog,
@@ -56,6 +57,44 @@ def test_write_version_updates_pyproject_and_module(project_tmp: VersionConfig)
     assert '__version__ = "1.2.4"' in project_tmp.module_path.read_text(encoding="utf-8")
 
 
+def test_write_version_reuses_pyproject_read(project_tmp: VersionConfig, monkeypatch: pytest.MonkeyPatch) -> None:
+    reads: list[Path] = []
+    original = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    assert read_version(project_tmp) == "1.2.3"
+    write_version(project_tmp, "1.2.4")
+    assert reads.count(project_tmp.pyproject_path) == 1
+    assert read_version(project_tmp) == "1.2.4"
+
+
+def test_apply_version_bump_updates_all_files(project_tmp: VersionConfig) -> None:
+    timestamp = dt.datetime(2025, 10, 26, 3, 15, 0, tzinfo=dt.timezone.utc)
+    entry = apply_version_bump(project_tmp, "1.2.4", timestamp, ["Bumped patch version."])
+    assert entry.startswith("## [1.2.4] - 2025-10-26T03:15:00Z")
+    assert read_version(project_tmp) == "1.2.4"
+    assert '__version__ = "1.2.4"' in project_tmp.module_path.read_text(encoding="utf-8")
+    assert "- Bumped patch version." in project_tmp.changelog_path.read_text(encoding="utf-8")
+    assert sorted(path.name for path in project_tmp.project_root.iterdir()) == [
+        "CHANGELOG.md",
+        "aware_pkg",
+        "pyproject.toml",
+    ]
+
+
+def test_apply_version_bump_writes_nothing_on_error(project_tmp: VersionConfig) -> None:
+    project_tmp.module_path.write_text("VERSION = '1.2.3'\n", encoding="utf-8")
+    timestamp = dt.datetime(2025, 10, 26, 3, 15, 0, tzinfo=dt.timezone.utc)
+    with pytest.raises(ValueError, match="__version__"):
+        apply_version_bump(project_tmp, "1.2.4", timestamp, None)
+    assert read_version(project_tmp) == "1.2.3"
+    assert project_tmp.changelog_path.read_text(encoding="utf-8") == "# Changelog\n\n"
+
+
 def test_update_changelog_inserts_entry(project_tmp: VersionConfig) -> None:
     timestamp = dt.datetime(2025, 10, 26, 3, 15, 0, tzinfo=dt.timezone.utc)
     entry = update_changelog(project_tmp, "1.2.4", timestamp, ["Bumped patch version."])
@@ -132,3 +171,10 @@ def test_update_changelog_deduplicates_summary(project_tmp: VersionConfig) -> No
     )
     assert section in content
     assert content.count("resolve_secret_info()") == 1
+
+
+def test_read_version_sees_external_edits(project_tmp: VersionConfig) -> None:
+    assert read_version(project_tmp) == "1.2.3"
+    text = project_tmp.pyproject_path.read_text(encoding="utf-8")
+    project_tmp.pyproject_path.write_text(text.replace("1.2.3", "1.2.30"), encoding="utf-8")
+    assert read_version(project_tmp) == "1.2.30"